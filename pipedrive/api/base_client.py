@@ -1,15 +1,40 @@
+import asyncio
+import copy
 import json
-from typing import Any, Dict, Optional
+import logging
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
+import orjson
 
 from log_config import logger
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
 from pipedrive.pipedrive_config import settings
 
 
+def _format_json_for_log(data: Any) -> str:
+    """Pretty-print JSON data for debug logging."""
+    return orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+    ).decode()
+
+
+class _InflightRequest:
+    """A GET request on the wire and how many callers are waiting on it."""
+
+    __slots__ = ("task", "callers")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.callers = 0
+
+
 class BaseClient:
     """Base client for Pipedrive API interactions"""
+
+    # Maximum number of ETag-tagged GET responses kept for revalidation
+    ETAG_CACHE_SIZE = 512
     
     def __init__(
         self, api_token: str, company_domain: str, http_client: httpx.AsyncClient
@@ -28,6 +53,11 @@ class BaseClient:
         # Default to v2 for backward compatibility
         self.api_version = "v2"
         self.http_client = http_client
+        # Raw response bodies by request, decoded afresh on every 304 so no
+        # two callers ever share the same parsed objects
+        self._etag_cache: Dict[Tuple[str, Tuple], Tuple[str, bytes]] = {}
+        # GET requests currently on the wire, shared by identical callers
+        self._inflight: Dict[Tuple, _InflightRequest] = {}
         logger.debug("BaseClient initialized.")
     
     def get_url(self, endpoint: str, version: Optional[str] = None) -> str:
@@ -53,6 +83,18 @@ class BaseClient:
         else:
             raise ValueError(f"Unsupported API version: {version}")
 
+    def _store_etag(
+        self, key: Tuple[str, Tuple], etag: Optional[str], content: bytes
+    ) -> None:
+        """Remember a response by ETag, evicting the oldest entry when full."""
+        if not etag:
+            # Endpoint doesn't support conditional requests
+            return
+        self._etag_cache.pop(key, None)
+        if len(self._etag_cache) >= self.ETAG_CACHE_SIZE:
+            del self._etag_cache[next(iter(self._etag_cache))]
+        self._etag_cache[key] = (etag, content)
+
     async def request(
         self,
         method: str,
@@ -60,6 +102,7 @@ class BaseClient:
         query_params: Optional[Dict[str, Any]] = None,
         json_payload: Optional[Dict[str, Any]] = None,
         version: Optional[str] = None,
+        revalidate: bool = False,
     ) -> Dict[str, Any]:
         """
         Make a request to the Pipedrive API with version control
@@ -70,6 +113,8 @@ class BaseClient:
             query_params: URL query parameters
             json_payload: JSON request body
             version: API version to use (v1 or v2), defaults to client's default version
+            revalidate: For GET requests, remember the response ETag and send
+                If-None-Match next time, reusing the stored response on 304
             
         Returns:
             API response data
@@ -78,6 +123,59 @@ class BaseClient:
             PipedriveAPIError: If the API request fails
             ValueError: If an unsupported API version is specified
         """
+        if method != "GET":
+            return await self._request(
+                method, endpoint, query_params, json_payload, version, revalidate
+            )
+
+        # Identical GETs issued while one is already in flight await its
+        # response instead of sending another request. The request is
+        # shielded, so a cancelled caller doesn't cancel it for the others.
+        # When a response is shared, each caller gets its own copy so one
+        # caller mutating its result can't change what the others see.
+        key = (
+            self.get_url(endpoint, version),
+            tuple(sorted(
+                (k, repr(v)) for k, v in (query_params or {}).items() if v is not None
+            )),
+            revalidate,
+        )
+        inflight = self._inflight.get(key)
+        # A finished task may not have been removed yet, but it is never joined
+        if inflight is None or inflight.task.done():
+            task = asyncio.ensure_future(self._request(
+                method, endpoint, query_params, json_payload, version, revalidate
+            ))
+            inflight = self._inflight[key] = _InflightRequest(task)
+            task.add_done_callback(partial(self._inflight_done, key))
+        inflight.callers += 1
+        response_data = await asyncio.shield(inflight.task)
+        # Callers only join while the task is running and none resumes before
+        # it finishes, so the count is final by the time any caller reads it
+        if inflight.callers > 1:
+            return copy.deepcopy(response_data)
+        return response_data
+
+    def _inflight_done(self, key: Tuple, task: asyncio.Task) -> None:
+        """Forget a finished GET and mark its exception, if any, as retrieved."""
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.task is task:
+            del self._inflight[key]
+        # If every caller was cancelled nobody else reads the exception, and
+        # asyncio would warn that it was never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        query_params: Optional[Dict[str, Any]],
+        json_payload: Optional[Dict[str, Any]],
+        version: Optional[str],
+        revalidate: bool,
+    ) -> Dict[str, Any]:
+        """Send a single request to the Pipedrive API (see request)."""
         url = self.get_url(endpoint, version)
 
         params_to_send = {"api_token": self.api_token}
@@ -91,35 +189,52 @@ class BaseClient:
         if json_payload:
             headers["Content-Type"] = "application/json"
 
-        logger.debug(f"BaseClient Request: {method} {url}")
-        if params_to_send:
-            logger.debug(f"URL Params: {params_to_send}")
-        if json_payload:
-            logger.debug(
-                f"JSON Payload: {json.dumps(json_payload, indent=2)}"
-            )
+        etag_key = None
+        etag_entry = None
+        if revalidate and method == "GET":
+            etag_key = (url, tuple(sorted(params_to_send.items())))
+            etag_entry = self._etag_cache.get(etag_key)
+            if etag_entry is not None:
+                headers["If-None-Match"] = etag_entry[0]
+
+        # Request/response dumps are costly for large payloads, so they are
+        # only built when debug logging is actually enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("BaseClient Request: %s %s", method, url)
+            if params_to_send:
+                logger.debug("URL Params: %s", params_to_send)
+            if json_payload:
+                logger.debug("JSON Payload: %s", _format_json_for_log(json_payload))
 
         try:
             response = await self.http_client.request(
                 method, url, params=params_to_send, json=json_payload, headers=headers
             )
-            logger.debug(f"Pipedrive API Response Status: {response.status_code}")
+            if debug:
+                logger.debug("Pipedrive API Response Status: %s", response.status_code)
+                try:
+                    # Attempt to log raw response for better debugging
+                    raw_response_text = response.text
+                    logger.debug(
+                        "Pipedrive API Raw Response Text: %s...", raw_response_text[:1000]
+                    )
+                except Exception as read_err:
+                    logger.warning(f"Could not log raw response text: {read_err}")
 
-            try:
-                # Attempt to log raw response for better debugging
-                raw_response_text = response.text
-                logger.debug(
-                    f"Pipedrive API Raw Response Text: {raw_response_text[:1000]}..."
-                )
-            except Exception as read_err:
-                logger.warning(f"Could not log raw response text: {read_err}")
+            if etag_entry is not None and response.status_code == 304:
+                logger.debug("Pipedrive API response not modified, reusing stored response.")
+                return orjson.loads(etag_entry[1])
 
             response.raise_for_status()  # Check for HTTP errors
 
-            response_data = response.json()  # Parse JSON
-            logger.debug(
-                f"Pipedrive API Parsed JSON Response: {json.dumps(response_data, indent=2)}"
-            )
+            # orjson decodes the raw bytes directly, skipping the text decode
+            response_data = orjson.loads(response.content)
+            if debug:
+                logger.debug(
+                    "Pipedrive API Parsed JSON Response: %s",
+                    _format_json_for_log(response_data),
+                )
 
             if not response_data.get("success"):
                 error_message = response_data.get(
@@ -137,6 +252,8 @@ class BaseClient:
                 )
 
             logger.debug("Pipedrive API call successful, success flag was true.")
+            if etag_key is not None:
+                self._store_etag(etag_key, response.headers.get("ETag"), response.content)
             return response_data
 
         except httpx.HTTPStatusError as e:
@@ -1,22 +1,51 @@
 import json
+import time
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from uuid import UUID
 
 from log_config import logger
 from pipedrive.api.base_client import BaseClient
+from pipedrive.pipedrive_config import settings
 
 
 class LeadClient:
-    """Client for Pipedrive Lead API endpoints"""
+    """Client for Pipedrive Lead API endpoints
 
-    def __init__(self, base_client: BaseClient):
+    Lead labels and sources are account-level reference data that rarely
+    change, so they are cached for cache_ttl seconds.
+    """
+
+    def __init__(self, base_client: BaseClient, cache_ttl: Optional[float] = None):
         """
         Initialize the Lead client
 
         Args:
             base_client: BaseClient instance for making API requests
+            cache_ttl: Seconds lead labels and sources stay cached, 0 disables
+                caching (defaults to settings.cache_ttl)
         """
         self.base_client = base_client
+        self.cache_ttl = settings.cache_ttl if cache_ttl is None else cache_ttl
+        self._reference_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop the cached lead labels and sources."""
+        self._reference_cache.clear()
+
+    async def _get_reference_data(self, endpoint: str) -> List[Dict[str, Any]]:
+        """Fetch a v1 reference data list, serving it from the cache while fresh."""
+        entry = self._reference_cache.get(endpoint)
+        if entry is not None and entry[0] > time.monotonic():
+            logger.debug("LeadClient: Returning cached %s", endpoint)
+            return entry[1]
+
+        response_data = await self.base_client.request(
+            "GET", endpoint, version="v1", revalidate=True
+        )
+        data = response_data.get("data") or []
+        if self.cache_ttl > 0:
+            self._reference_cache[endpoint] = (time.monotonic() + self.cache_ttl, data)
+        return data
 
     async def create_lead(
         self,
@@ -557,12 +586,8 @@ class LeadClient:
         logger.info("LeadClient: Getting all lead labels")
 
         try:
-            # Use v1 endpoint for lead labels
-            response_data = await self.base_client.request(
-                "GET", "/leadLabels", version="v1"
-            )
-
-            labels = response_data.get("data", [])
+            # Lead labels are only available on the v1 endpoint
+            labels = await self._get_reference_data("/leadLabels")
             logger.info(f"LeadClient: Got {len(labels)} lead labels")
 
             return labels
@@ -584,12 +609,8 @@ class LeadClient:
         logger.info("LeadClient: Getting all lead sources")
 
         try:
-            # Use v1 endpoint for lead sources
-            response_data = await self.base_client.request(
-                "GET", "/leadSources", version="v1"
-            )
-
-            sources = response_data.get("data", [])
+            # Lead sources are only available on the v1 endpoint
+            sources = await self._get_reference_data("/leadSources")
             logger.info(f"LeadClient: Got {len(sources)} lead sources")
 
             return sources
@@ -325,4 +325,48 @@ class TestLeadClient:
         assert args[1] == "/leadSources"
         assert kwargs["version"] == "v1"
         
-        assert result == mock_response["data"]
\ No newline at end of file
+        assert result == mock_response["data"]
+
+    async def test_get_lead_labels_is_cached(self, lead_client, mock_base_client):
+        """Test that lead labels are served from the cache until cleared"""
+        mock_base_client.request.return_value = {
+            "success": True,
+            "data": [{"id": "id1", "name": "Hot", "color": "red"}]
+        }
+
+        first = await lead_client.get_lead_labels()
+        second = await lead_client.get_lead_labels()
+
+        assert first == second
+        mock_base_client.request.assert_called_once_with(
+            "GET", "/leadLabels", version="v1", revalidate=True
+        )
+
+        lead_client.clear_cache()
+        await lead_client.get_lead_labels()
+        assert mock_base_client.request.call_count == 2
+
+    async def test_get_lead_sources_cache_expires(self, lead_client, mock_base_client):
+        """Test that cached lead sources are refetched after the TTL"""
+        mock_base_client.request.return_value = {
+            "success": True,
+            "data": [{"name": "API"}]
+        }
+
+        with patch("pipedrive.api.features.leads.client.lead_client.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            await lead_client.get_lead_sources()
+            mock_time.return_value = 1000.0 + lead_client.cache_ttl + 1
+            await lead_client.get_lead_sources()
+
+        assert mock_base_client.request.call_count == 2
+
+    async def test_reference_cache_disabled_with_zero_ttl(self, mock_base_client):
+        """Test that a cache_ttl of 0 disables caching"""
+        lead_client = LeadClient(mock_base_client, cache_ttl=0)
+        mock_base_client.request.return_value = {"success": True, "data": []}
+
+        await lead_client.get_lead_labels()
+        await lead_client.get_lead_labels()
+
+        assert mock_base_client.request.call_count == 2
@@ -1,10 +1,9 @@
 """Tool for adding comments to notes in Pipedrive."""
 from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_decorator import tool
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import format_tool_response, get_pipedrive_client
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from log_config import logger
 
 
@@ -38,8 +37,7 @@ async def add_comment_to_note_in_pipedrive(
         JSON string with success status and created comment data, or error message
     """
     try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
+        client = get_pipedrive_client(ctx)
 
         note_id_int, error = convert_id_string(note_id, "note_id")
         if error:
@@ -56,11 +54,11 @@ async def add_comment_to_note_in_pipedrive(
         return format_tool_response(success=True, data=result)
 
     except PipedriveAPIError as e:
-        error_msg = f"Pipedrive API error: {str(e)}"
+        error_msg = f"Pipedrive API error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except Exception as e:
-        error_msg = f"Unexpected error adding comment: {str(e)}"
+        error_msg = f"Unexpected error adding comment: {e}"
         logger.exception(error_msg)
         return format_tool_response(False, error_message=error_msg)
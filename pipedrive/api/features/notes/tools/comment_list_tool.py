@@ -2,10 +2,9 @@
 from typing import Optional
 from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_decorator import tool
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import format_tool_response, get_pipedrive_client
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from log_config import logger
 
 
@@ -39,8 +38,7 @@ async def list_comments_on_note_in_pipedrive(
         JSON string with success status, list of comments, and pagination info
     """
     try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
+        client = get_pipedrive_client(ctx)
 
         note_id_int, error = convert_id_string(note_id, "note_id")
         if error:
@@ -73,11 +71,11 @@ async def list_comments_on_note_in_pipedrive(
         )
 
     except PipedriveAPIError as e:
-        error_msg = f"Pipedrive API error: {str(e)}"
+        error_msg = f"Pipedrive API error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except Exception as e:
-        error_msg = f"Unexpected error listing comments: {str(e)}"
+        error_msg = f"Unexpected error listing comments: {e}"
         logger.exception(error_msg)
         return format_tool_response(False, error_message=error_msg)
@@ -2,10 +2,9 @@
 from typing import Optional
 from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_decorator import tool
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import format_tool_response, get_pipedrive_client
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from pydantic import ValidationError
 from log_config import logger
 
@@ -55,16 +54,15 @@ async def create_note_in_pipedrive(
         JSON string with success status and created note data, or error message
     """
     try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
+        client = get_pipedrive_client(ctx)
 
         # Sanitize empty strings to None
-        lead_id = lead_id.strip() if lead_id and lead_id.strip() else None
-        deal_id_str = deal_id.strip() if deal_id and deal_id.strip() else None
-        person_id_str = person_id.strip() if person_id and person_id.strip() else None
-        org_id_str = org_id.strip() if org_id and org_id.strip() else None
-        project_id_str = project_id.strip() if project_id and project_id.strip() else None
-        user_id_str = user_id.strip() if user_id and user_id.strip() else None
+        lead_id = (lead_id.strip() or None) if lead_id else None
+        deal_id_str = (deal_id.strip() or None) if deal_id else None
+        person_id_str = (person_id.strip() or None) if person_id else None
+        org_id_str = (org_id.strip() or None) if org_id else None
+        project_id_str = (project_id.strip() or None) if project_id else None
+        user_id_str = (user_id.strip() or None) if user_id else None
 
         # Convert numeric IDs
         deal_id_int = None
@@ -139,16 +137,16 @@ async def create_note_in_pipedrive(
         )
 
     except ValidationError as e:
-        error_msg = f"Validation error: {str(e)}"
+        error_msg = f"Validation error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except PipedriveAPIError as e:
-        error_msg = f"Pipedrive API error: {str(e)}"
+        error_msg = f"Pipedrive API error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except Exception as e:
-        error_msg = f"Unexpected error creating note: {str(e)}"
+        error_msg = f"Unexpected error creating note: {e}"
         logger.exception(error_msg)
         return format_tool_response(False, error_message=error_msg)
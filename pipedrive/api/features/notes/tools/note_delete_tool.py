@@ -1,10 +1,9 @@
 """Tool for deleting notes from Pipedrive."""
 from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_decorator import tool
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import format_tool_response, get_pipedrive_client
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from log_config import logger
 
 
@@ -27,8 +26,7 @@ async def delete_note_from_pipedrive(ctx: Context, note_id: str) -> str:
         JSON string with success status and deletion confirmation, or error message
     """
     try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
+        client = get_pipedrive_client(ctx)
 
         # Convert note_id to integer
         note_id_int, error = convert_id_string(note_id, "note_id")
@@ -44,11 +42,11 @@ async def delete_note_from_pipedrive(ctx: Context, note_id: str) -> str:
         )
 
     except PipedriveAPIError as e:
-        error_msg = f"Pipedrive API error: {str(e)}"
+        error_msg = f"Pipedrive API error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except Exception as e:
-        error_msg = f"Unexpected error deleting note: {str(e)}"
+        error_msg = f"Unexpected error deleting note: {e}"
         logger.exception(error_msg)
         return format_tool_response(False, error_message=error_msg)
@@ -2,12 +2,23 @@
 from typing import Optional
 from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_decorator import tool
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import format_tool_response, get_pipedrive_client
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from log_config import logger
 
+# Entity fields paired with their pin flag, in order of precedence
+_PIN_TARGETS = (
+    ("lead_id", "pinned_to_lead_flag"),
+    ("deal_id", "pinned_to_deal_flag"),
+    ("person_id", "pinned_to_person_flag"),
+    ("org_id", "pinned_to_organization_flag"),
+    ("project_id", "pinned_to_project_flag"),
+)
+
+# API value for each pinned state
+_PIN_MAP = {True: 1, False: 0}
+
 
 @tool("notes")
 async def update_note_in_pipedrive(
@@ -53,8 +64,7 @@ async def update_note_in_pipedrive(
         JSON string with success status and updated note data, or error message
     """
     try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
+        client = get_pipedrive_client(ctx)
 
         # Convert note_id to integer
         note_id_int, error = convert_id_string(note_id, "note_id")
@@ -62,11 +72,11 @@ async def update_note_in_pipedrive(
             return format_tool_response(False, error_message=error)
 
         # Sanitize empty strings to None
-        lead_id = lead_id.strip() if lead_id and lead_id.strip() else None
-        deal_id_str = deal_id.strip() if deal_id and deal_id.strip() else None
-        person_id_str = person_id.strip() if person_id and person_id.strip() else None
-        org_id_str = org_id.strip() if org_id and org_id.strip() else None
-        project_id_str = project_id.strip() if project_id and project_id.strip() else None
+        lead_id = (lead_id.strip() or None) if lead_id else None
+        deal_id_str = (deal_id.strip() or None) if deal_id else None
+        person_id_str = (person_id.strip() or None) if person_id else None
+        org_id_str = (org_id.strip() or None) if org_id else None
+        project_id_str = (project_id.strip() or None) if project_id else None
 
         # Convert numeric IDs
         deal_id_int = None
@@ -95,34 +105,41 @@ async def update_note_in_pipedrive(
                 return format_tool_response(False, error_message=error)
 
         # Determine pinning flags based on entity type if pinned is set
-        pinned_to_lead_flag = None
-        pinned_to_deal_flag = None
-        pinned_to_person_flag = None
-        pinned_to_organization_flag = None
-        pinned_to_project_flag = None
+        pin_flags = dict.fromkeys(flag_field for _, flag_field in _PIN_TARGETS)
 
         if pinned is not None:
-            pin_value = 1 if pinned else 0
-            # Determine which entity is being updated
-            if lead_id:
-                pinned_to_lead_flag = pin_value
-            elif deal_id_int:
-                pinned_to_deal_flag = pin_value
-            elif person_id_int:
-                pinned_to_person_flag = pin_value
-            elif org_id_int:
-                pinned_to_organization_flag = pin_value
-            elif project_id_int:
-                pinned_to_project_flag = pin_value
+            pin_value = _PIN_MAP[pinned]
+            entities = {
+                "lead_id": lead_id,
+                "deal_id": deal_id_int,
+                "person_id": person_id_int,
+                "org_id": org_id_int,
+                "project_id": project_id_int,
+            }
+
+            if not any(entities.values()):
+                # No entity is being changed, so look up the note to find the
+                # entity it is currently attached to. Sending every flag would
+                # rely on the API silently ignoring the irrelevant ones.
+                entities = await client.notes.get_note(note_id_int) or {}
+                if not entities:
+                    return format_tool_response(
+                        False, error_message=f"Note with ID {note_id_int} not found"
+                    )
+
+            # Pin to the first entity present, in order of precedence
+            for entity_field, flag_field in _PIN_TARGETS:
+                if entities.get(entity_field):
+                    pin_flags[flag_field] = pin_value
+                    break
             else:
-                # If no entity is being changed, we need to get current note to determine entity
-                # For now, we'll set all flags to the same value
-                # The API will ignore irrelevant flags
-                pinned_to_lead_flag = pin_value
-                pinned_to_deal_flag = pin_value
-                pinned_to_person_flag = pin_value
-                pinned_to_organization_flag = pin_value
-                pinned_to_project_flag = pin_value
+                return format_tool_response(
+                    False,
+                    error_message=(
+                        f"Note with ID {note_id_int} is not attached to an "
+                        "entity that can be pinned"
+                    ),
+                )
 
         # Update the note
         updated_note = await client.notes.update_note(
@@ -133,11 +150,7 @@ async def update_note_in_pipedrive(
             person_id=person_id_int,
             org_id=org_id_int,
             project_id=project_id_int,
-            pinned_to_lead_flag=pinned_to_lead_flag,
-            pinned_to_deal_flag=pinned_to_deal_flag,
-            pinned_to_person_flag=pinned_to_person_flag,
-            pinned_to_organization_flag=pinned_to_organization_flag,
-            pinned_to_project_flag=pinned_to_project_flag,
+            **pin_flags,
         )
 
         return format_tool_response(
@@ -146,16 +159,16 @@ async def update_note_in_pipedrive(
         )
 
     except ValueError as e:
-        error_msg = f"Validation error: {str(e)}"
+        error_msg = f"Validation error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except PipedriveAPIError as e:
-        error_msg = f"Pipedrive API error: {str(e)}"
+        error_msg = f"Pipedrive API error: {e}"
         logger.error(error_msg)
         return format_tool_response(False, error_message=error_msg)
 
     except Exception as e:
-        error_msg = f"Unexpected error updating note: {str(e)}"
+        error_msg = f"Unexpected error updating note: {e}"
         logger.exception(error_msg)
         return format_tool_response(False, error_message=error_msg)
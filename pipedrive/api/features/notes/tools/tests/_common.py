@@ -0,0 +1,18 @@
+"""Shared test data for the notes tool tests."""
+import pytest
+
+from pipedrive.api.pipedrive_api_error import PipedriveAPIError
+
+# Client side effects paired with the error prefix the tools report for them
+API_AND_UNEXPECTED_ERRORS = [
+    pytest.param(
+        PipedriveAPIError("Not found", status_code=404),
+        "Pipedrive API error",
+        id="api_error",
+    ),
+    pytest.param(
+        Exception("Something went wrong"),
+        "Unexpected error",
+        id="unexpected_error",
+    ),
+]
@@ -0,0 +1,64 @@
+import pytest
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from pipedrive.api.features.notes.client.comment_client import CommentClient
+from pipedrive.api.features.notes.client.note_client import NoteClient
+from pipedrive.api.features.notes import notes_tool_registry  # noqa: F401
+from pipedrive.api.features.tool_registry import registry
+
+
+@pytest.fixture(scope="session", autouse=True)
+def enable_notes_feature():
+    """
+    Fixture to enable the 'notes' feature once for all tests in this directory.
+
+    The feature is registered by the notes_tool_registry import above, which
+    must happen before the feature can be enabled.
+    """
+    registry.enable_feature("notes")
+    yield
+
+
+@pytest.fixture(scope="module")
+def mock_context():
+    """
+    Create a mock MCP context once per test module.
+
+    The notes client mocks are reset after every test by reset_notes_client,
+    so return values and side effects never leak between tests.
+    """
+    # Specced mocks only expose real client attributes, and their async
+    # methods are created as AsyncMock automatically
+    notes_client = MagicMock(spec=NoteClient)
+    notes_client.comments = MagicMock(spec=CommentClient)
+
+    # The tools only walk attributes down to the client, so plain namespaces
+    # are enough for the context itself
+    return SimpleNamespace(
+        request_context=SimpleNamespace(
+            lifespan_context=SimpleNamespace(
+                pipedrive_client=SimpleNamespace(notes=notes_client)
+            )
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def notes_client(mock_context):
+    """Get the mock notes client from the mock context"""
+    return mock_context.request_context.lifespan_context.pipedrive_client.notes
+
+
+@pytest.fixture
+def stub_notes_method(notes_client, stub_client_method):
+    """Stub a notes client method with a plain coroutine (see stub_client_method)."""
+    return partial(stub_client_method, notes_client)
+
+
+@pytest.fixture(autouse=True)
+def reset_notes_client(notes_client):
+    """Reset the shared notes client mocks after each test."""
+    yield
+    notes_client.reset_mock(return_value=True, side_effect=True)
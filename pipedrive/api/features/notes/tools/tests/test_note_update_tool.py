@@ -1,42 +1,19 @@
 """Tests for update_note_in_pipedrive tool."""
 import pytest
-import json
-from unittest.mock import AsyncMock, MagicMock
+import orjson
 from pipedrive.api.features.notes.tools.note_update_tool import update_note_in_pipedrive
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.features.tool_registry import registry
 
 
-@pytest.fixture(autouse=True)
-def enable_notes_feature():
-    """Enable the notes feature for all tests."""
-    from pipedrive.api.features.notes import notes_tool_registry
-    registry.enable_feature("notes")
-    yield
-
-
-@pytest.fixture
-def mock_context():
-    """Create a mock MCP context."""
-    notes_client = MagicMock()
-    notes_client.update_note = AsyncMock()
-
-    pipedrive_client = MagicMock()
-    pipedrive_client.notes = notes_client
-
-    ctx = MagicMock()
-    ctx.request_context.lifespan_context.pipedrive_client = pipedrive_client
-
-    return ctx
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 class TestUpdateNoteTool:
     """Tests for update_note_in_pipedrive tool."""
 
-    @pytest.mark.asyncio
-    async def test_update_note_content(self, mock_context):
+    async def test_update_note_content(self, mock_context, notes_client):
         """Test updating note content."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.return_value = {
+        notes_client.update_note.return_value = {
             "id": 123,
             "content": "Updated content",
             "deal_id": 456
@@ -48,18 +25,17 @@ class TestUpdateNoteTool:
             content="Updated content"
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is True
         assert response["data"]["content"] == "Updated content"
 
-        call_kwargs = mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.call_args.kwargs
+        call_kwargs = notes_client.update_note.call_args.kwargs
         assert call_kwargs["note_id"] == 123
         assert call_kwargs["content"] == "Updated content"
 
-    @pytest.mark.asyncio
-    async def test_update_note_change_entity(self, mock_context):
+    async def test_update_note_change_entity(self, mock_context, notes_client):
         """Test changing note attachment to different entity."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.return_value = {
+        notes_client.update_note.return_value = {
             "id": 123,
             "content": "Note",
             "person_id": 789
@@ -71,16 +47,21 @@ class TestUpdateNoteTool:
             person_id="789"
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is True
 
-        call_kwargs = mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.call_args.kwargs
+        call_kwargs = notes_client.update_note.call_args.kwargs
         assert call_kwargs["person_id"] == 789
 
-    @pytest.mark.asyncio
-    async def test_update_note_toggle_pinning(self, mock_context):
+    async def test_update_note_toggle_pinning(self, mock_context, notes_client):
         """Test toggling note pinning."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.return_value = {
+        notes_client.get_note.return_value = {
+            "id": 123,
+            "content": "Note",
+            "deal_id": 456,
+            "pinned_to_deal_flag": 0
+        }
+        notes_client.update_note.return_value = {
             "id": 123,
             "content": "Note",
             "deal_id": 456,
@@ -93,17 +74,28 @@ class TestUpdateNoteTool:
             pinned=True
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is True
 
-        call_kwargs = mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.call_args.kwargs
-        # When pinned=True and no entity specified, all flags should be set
+        # When no entity is specified, the note is looked up to find its entity
+        notes_client.get_note.assert_called_once_with(123)
+
+        call_kwargs = notes_client.update_note.call_args.kwargs
         assert call_kwargs["pinned_to_deal_flag"] == 1
+        assert call_kwargs["pinned_to_lead_flag"] is None
+        assert call_kwargs["pinned_to_person_flag"] is None
+        assert call_kwargs["pinned_to_organization_flag"] is None
+        assert call_kwargs["pinned_to_project_flag"] is None
 
-    @pytest.mark.asyncio
-    async def test_update_note_unpin(self, mock_context):
+    async def test_update_note_unpin(self, mock_context, notes_client):
         """Test unpinning a note."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.return_value = {
+        notes_client.get_note.return_value = {
+            "id": 123,
+            "content": "Note",
+            "deal_id": 456,
+            "pinned_to_deal_flag": 1
+        }
+        notes_client.update_note.return_value = {
             "id": 123,
             "content": "Note",
             "deal_id": 456,
@@ -116,62 +108,86 @@ class TestUpdateNoteTool:
             pinned=False
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is True
 
-        call_kwargs = mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.call_args.kwargs
+        call_kwargs = notes_client.update_note.call_args.kwargs
         assert call_kwargs["pinned_to_deal_flag"] == 0
 
-    @pytest.mark.asyncio
-    async def test_update_note_invalid_id(self, mock_context):
-        """Test error handling for invalid note ID."""
+    async def test_update_note_pinning_note_not_found(self, mock_context, notes_client):
+        """Test pinning a note that doesn't exist returns a not-found error."""
+        notes_client.get_note.return_value = None
+
         result = await update_note_in_pipedrive(
             mock_context,
-            note_id="invalid",
-            content="Test"
+            note_id="999",
+            pinned=True
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is False
-        assert "note_id" in response["error"]
+        assert "Note with ID 999 not found" in response["error"]
+        notes_client.update_note.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_update_note_api_error(self, mock_context):
-        """Test handling of API errors."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.side_effect = PipedriveAPIError(
-            "Note not found", status_code=404
-        )
+    async def test_update_note_pinning_without_pin_target(self, mock_context, notes_client):
+        """Test pinning a note attached to no pinnable entity returns an error."""
+        notes_client.get_note.return_value = {"id": 123, "content": "Note"}
 
         result = await update_note_in_pipedrive(
             mock_context,
             note_id="123",
-            content="Updated"
+            pinned=True
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is False
-        assert "Pipedrive API error" in response["error"]
+        assert "Note with ID 123 is not attached to an entity that can be pinned" in response["error"]
+        notes_client.update_note.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_update_note_value_error(self, mock_context):
-        """Test handling of ValueError from client."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.side_effect = ValueError(
-            "At least one field must be provided for update"
+    async def test_update_note_invalid_id(self, mock_context):
+        """Test error handling for invalid note ID."""
+        result = await update_note_in_pipedrive(
+            mock_context,
+            note_id="invalid",
+            content="Test"
         )
 
+        response = orjson.loads(result)
+        assert response["success"] is False
+        assert "note_id" in response["error"]
+
+    @pytest.mark.parametrize(
+        "side_effect,expected_error",
+        [
+            pytest.param(
+                PipedriveAPIError("Note not found", status_code=404),
+                "Pipedrive API error",
+                id="api_error",
+            ),
+            pytest.param(
+                ValueError("At least one field must be provided for update"),
+                "Validation error",
+                id="value_error",
+            ),
+        ],
+    )
+    async def test_update_note_errors(self, mock_context, notes_client, side_effect, expected_error):
+        """Test handling of API and validation errors from the client."""
+        notes_client.update_note.side_effect = side_effect
+
         result = await update_note_in_pipedrive(
             mock_context,
-            note_id="123"
+            note_id="123",
+            content="Updated"
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is False
-        assert "Validation error" in response["error"]
+        assert expected_error in response["error"]
 
-    @pytest.mark.asyncio
-    async def test_update_note_multiple_fields(self, mock_context):
+    async def test_update_note_multiple_fields(self, mock_context, notes_client):
         """Test updating multiple fields at once."""
-        mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.return_value = {
+        notes_client.update_note.return_value = {
             "id": 123,
             "content": "New content",
             "person_id": 789,
@@ -186,10 +202,14 @@ class TestUpdateNoteTool:
             pinned=True
         )
 
-        response = json.loads(result)
+        response = orjson.loads(result)
         assert response["success"] is True
 
-        call_kwargs = mock_context.request_context.lifespan_context.pipedrive_client.notes.update_note.call_args.kwargs
+        call_kwargs = notes_client.update_note.call_args.kwargs
         assert call_kwargs["content"] == "New content"
         assert call_kwargs["person_id"] == 789
         assert call_kwargs["pinned_to_person_flag"] == 1
+        assert call_kwargs["pinned_to_deal_flag"] is None
+
+        # The entity is known, so no lookup is needed
+        notes_client.get_note.assert_not_called()
@@ -1,14 +1,262 @@
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from log_config import logger
 from pipedrive.api.base_client import BaseClient
+from pipedrive.pipedrive_config import settings
+
+# Shared result for empty pages. Callers only read pages, never mutate them.
+_EMPTY_LIST: List[Dict[str, Any]] = []
+
+
+def _next_cursor(response_data: Dict[str, Any]) -> Optional[str]:
+    """Return the pagination cursor from a list response, if any."""
+    additional_data = response_data.get("additional_data")
+    return additional_data.get("next_cursor") if additional_data else None
+
+
+class _BatchLoader:
+    """Coalesces concurrent single-ID lookups into one batch call.
+
+    IDs requested during the same event loop iteration are collected and
+    handed to batch_fn together on the next iteration (or as soon as
+    max_batch_size IDs are waiting). batch_fn returns a dict mapping each ID
+    to its result, or to an exception that is raised for that ID only.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[int]], Awaitable[Dict[int, Any]]],
+        max_batch_size: int = 50,
+    ):
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: int) -> Any:
+        """Return the result for key once its batch has been fetched."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_soon(self._flush)
+        # Shield so one cancelled caller doesn't cancel the shared lookup
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[int, asyncio.Future]) -> None:
+        try:
+            results = await self._batch_fn(list(batch))
+        except Exception as e:
+            results = dict.fromkeys(batch, e)
+        for key, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(key, {})
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 class PipelineClient:
-    """Client for Pipedrive Pipelines and Stages API endpoints (v2)"""
+    """Client for Pipedrive Pipelines and Stages API endpoints (v2)
+
+    Pipelines and stages rarely change, so successful reads are kept in a
+    small in-process TTL cache keyed by the method name and its arguments.
+    Once an entry expires, the request is revalidated with its ETag.
 
-    def __init__(self, base_client: BaseClient):
+    Concurrent get_pipeline/get_stage calls are collected, and when more
+    than BATCH_THRESHOLD distinct IDs are waiting they are resolved with one
+    list request (limit 500) instead of one GET each. That list response is
+    far larger than a single item, and IDs missing from it still need their
+    own GET, so a few lookups are cheaper sent individually. Below the
+    threshold the GETs are sent concurrently.
+    """
+
+    # Up to this many distinct concurrent IDs are fetched with one GET each
+    BATCH_THRESHOLD = 4
+
+    def __init__(
+        self,
+        base_client: BaseClient,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 512,
+    ):
+        """
+        Args:
+            base_client: Shared BaseClient used for HTTP requests
+            cache_ttl: Seconds a response stays cached, 0 disables caching
+                (defaults to settings.cache_ttl)
+            cache_size: Maximum number of cached responses
+        """
         self.base_client = base_client
+        self.cache_ttl = settings.cache_ttl if cache_ttl is None else cache_ttl
+        self.cache_size = cache_size
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._pipeline_loader = _BatchLoader(self._fetch_pipelines)
+        self._stage_loader = _BatchLoader(self._fetch_stages)
+
+    def _cache_get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        return value
+
+    def _cache_set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        if self.cache_ttl <= 0:
+            return
+        self._cache.pop(key, None)
+        if len(self._cache) >= self.cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+
+    def clear_cache(self) -> None:
+        """Drop all cached pipeline and stage responses."""
+        self._cache.clear()
+
+    async def _request_page(
+        self,
+        cache_key: Hashable,
+        endpoint: str,
+        params: Dict[str, Any],
+        item_method: str,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch and cache one page of a list endpoint.
+
+        Each item is also cached under (item_method, id), since the list and
+        single-item endpoints return the same shape.
+        """
+        response_data = await self.base_client.request(
+            "GET", endpoint, query_params=params, revalidate=True
+        )
+
+        items = response_data.get("data") or _EMPTY_LIST
+        next_cursor = _next_cursor(response_data)
+        self._cache_set(cache_key, (items, next_cursor))
+        for item in items:
+            if "id" in item:
+                self._cache_set((item_method, item["id"]), item)
+        return items, next_cursor
+
+    async def _fetch_batch(
+        self,
+        ids: List[int],
+        list_page: Callable[[], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]],
+        fetch_one: Callable[[int], Awaitable[Dict[str, Any]]],
+    ) -> Dict[int, Any]:
+        """
+        Resolve several IDs, with one list request when there are enough.
+
+        Up to BATCH_THRESHOLD IDs are fetched individually. Above that, IDs
+        missing from the first list page fall back to individual requests.
+        """
+        if len(ids) == 1:
+            return {ids[0]: await fetch_one(ids[0])}
+
+        results: Dict[int, Any] = {}
+        if len(ids) > self.BATCH_THRESHOLD:
+            items, _ = await list_page()
+            wanted = set(ids)
+            results = {
+                item["id"]: item for item in items if item.get("id") in wanted
+            }
+        missing = [item_id for item_id in ids if item_id not in results]
+        if missing:
+            fetched = await asyncio.gather(
+                *(fetch_one(item_id) for item_id in missing),
+                return_exceptions=True,
+            )
+            results.update(zip(missing, fetched))
+        return results
+
+    async def _fetch_pipelines(self, pipeline_ids: List[int]) -> Dict[int, Any]:
+        return await self._fetch_batch(
+            pipeline_ids,
+            lambda: self.list_pipelines(limit=500),
+            self._request_pipeline,
+        )
+
+    async def _fetch_stages(self, stage_ids: List[int]) -> Dict[int, Any]:
+        return await self._fetch_batch(
+            stage_ids,
+            lambda: self.list_stages(limit=500),
+            self._request_stage,
+        )
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[
+            [Optional[str]], Awaitable[Tuple[List[Dict[str, Any]], Optional[str]]]
+        ],
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield every page of a cursor-paginated listing.
+
+        The request for the next page is started before the current page is
+        yielded, so the caller's work on one page overlaps the network wait
+        for the next.
+        """
+        pending: Optional[asyncio.Task] = asyncio.ensure_future(fetch_page(None))
+        try:
+            while pending is not None:
+                items, next_cursor = await pending
+                pending = (
+                    asyncio.ensure_future(fetch_page(next_cursor))
+                    if next_cursor
+                    else None
+                )
+                yield items
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _request_pipeline(self, pipeline_id: int) -> Dict[str, Any]:
+        response_data = await self.base_client.request(
+            "GET", f"/pipelines/{pipeline_id}", revalidate=True
+        )
+        return response_data.get("data", {})
+
+    async def _request_stage(self, stage_id: int) -> Dict[str, Any]:
+        response_data = await self.base_client.request(
+            "GET", f"/stages/{stage_id}", revalidate=True
+        )
+        return response_data.get("data", {})
 
     async def list_pipelines(
         self,
@@ -29,48 +277,109 @@ class PipelineClient:
         Returns:
             Tuple of (list of pipeline dicts, next_cursor or None)
         """
+        cache_key = ("list_pipelines", limit, cursor, sort_by, sort_direction)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("PipelineClient: Returning cached pipelines")
+            return cached
+
         logger.info("PipelineClient: Listing pipelines")
 
         params: Dict[str, Any] = {"limit": limit}
-        if cursor:
-            params["cursor"] = cursor
-        if sort_by:
-            params["sort_by"] = sort_by
-        if sort_direction:
-            params["sort_direction"] = sort_direction
-
-        response_data = await self.base_client.request(
-            "GET", "/pipelines", query_params=params
+        params.update(
+            (key, value)
+            for key, value in (
+                ("cursor", cursor),
+                ("sort_by", sort_by),
+                ("sort_direction", sort_direction),
+            )
+            if value
         )
 
-        pipelines = response_data.get("data", []) or []
-        next_cursor = (
-            response_data.get("additional_data", {}).get("next_cursor")
+        pipelines, next_cursor = await self._request_page(
+            cache_key, "/pipelines", params, "get_pipeline"
         )
 
-        logger.info(f"PipelineClient: Retrieved {len(pipelines)} pipelines")
+        logger.info("PipelineClient: Retrieved %d pipelines", len(pipelines))
         return pipelines, next_cursor
 
     async def get_pipeline(self, pipeline_id: int) -> Dict[str, Any]:
         """
         Get a single pipeline by ID.
 
+        Concurrent lookups are coalesced into a single list request.
+
         Args:
             pipeline_id: The ID of the pipeline
 
         Returns:
             Dictionary containing pipeline data
         """
-        logger.info(f"PipelineClient: Fetching pipeline with ID {pipeline_id}")
+        cache_key = ("get_pipeline", pipeline_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("PipelineClient: Returning cached pipeline %s", pipeline_id)
+            return cached
 
-        response_data = await self.base_client.request(
-            "GET", f"/pipelines/{pipeline_id}"
-        )
+        logger.info("PipelineClient: Fetching pipeline with ID %s", pipeline_id)
 
-        pipeline_data = response_data.get("data", {})
-        logger.info(f"PipelineClient: Successfully retrieved pipeline {pipeline_id}")
+        pipeline_data = await self._pipeline_loader.load(pipeline_id)
+        logger.info("PipelineClient: Successfully retrieved pipeline %s", pipeline_id)
+        if pipeline_data:
+            self._cache_set(cache_key, pipeline_data)
         return pipeline_data
 
+    async def iter_pipelines(
+        self,
+        limit: int = 500,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all pipelines page by page, prefetching the next page.
+
+        Args:
+            limit: Items per page (max 500)
+            sort_by: Field to sort by (id, update_time, add_time)
+            sort_direction: Sort direction (asc, desc)
+
+        Yields:
+            Lists of pipeline dicts, one per page
+        """
+        async for page in self._iter_pages(
+            lambda cursor: self.list_pipelines(
+                limit=limit,
+                cursor=cursor,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            )
+        ):
+            yield page
+
+    async def list_all_pipelines(
+        self,
+        limit: int = 500,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List all pipelines, following pagination cursors.
+
+        Args:
+            limit: Items per page (max 500)
+            sort_by: Field to sort by (id, update_time, add_time)
+            sort_direction: Sort direction (asc, desc)
+
+        Returns:
+            List of all pipeline dicts
+        """
+        pipelines: List[Dict[str, Any]] = []
+        async for page in self.iter_pipelines(
+            limit=limit, sort_by=sort_by, sort_direction=sort_direction
+        ):
+            pipelines.extend(page)
+        return pipelines
+
     async def list_stages(
         self,
         pipeline_id: Optional[int] = None,
@@ -92,49 +401,119 @@ class PipelineClient:
         Returns:
             Tuple of (list of stage dicts, next_cursor or None)
         """
-        logger.info(
-            f"PipelineClient: Listing stages"
-            + (f" for pipeline {pipeline_id}" if pipeline_id else "")
+        cache_key = (
+            "list_stages", pipeline_id, limit, cursor, sort_by, sort_direction
         )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("PipelineClient: Returning cached stages")
+            return cached
 
-        params: Dict[str, Any] = {"limit": limit}
         if pipeline_id:
-            params["pipeline_id"] = pipeline_id
-        if cursor:
-            params["cursor"] = cursor
-        if sort_by:
-            params["sort_by"] = sort_by
-        if sort_direction:
-            params["sort_direction"] = sort_direction
+            logger.info("PipelineClient: Listing stages for pipeline %s", pipeline_id)
+        else:
+            logger.info("PipelineClient: Listing stages")
 
-        response_data = await self.base_client.request(
-            "GET", "/stages", query_params=params
+        params: Dict[str, Any] = {"limit": limit}
+        params.update(
+            (key, value)
+            for key, value in (
+                ("pipeline_id", pipeline_id),
+                ("cursor", cursor),
+                ("sort_by", sort_by),
+                ("sort_direction", sort_direction),
+            )
+            if value
         )
 
-        stages = response_data.get("data", []) or []
-        next_cursor = (
-            response_data.get("additional_data", {}).get("next_cursor")
+        stages, next_cursor = await self._request_page(
+            cache_key, "/stages", params, "get_stage"
         )
 
-        logger.info(f"PipelineClient: Retrieved {len(stages)} stages")
+        logger.info("PipelineClient: Retrieved %d stages", len(stages))
         return stages, next_cursor
 
+    async def iter_stages(
+        self,
+        pipeline_id: Optional[int] = None,
+        limit: int = 500,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all stages page by page, prefetching the next page.
+
+        Args:
+            pipeline_id: Filter stages for a specific pipeline
+            limit: Items per page (max 500)
+            sort_by: Field to sort by (id, update_time, add_time, order_nr)
+            sort_direction: Sort direction (asc, desc)
+
+        Yields:
+            Lists of stage dicts, one per page
+        """
+        async for page in self._iter_pages(
+            lambda cursor: self.list_stages(
+                pipeline_id=pipeline_id,
+                limit=limit,
+                cursor=cursor,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            )
+        ):
+            yield page
+
+    async def list_all_stages(
+        self,
+        pipeline_id: Optional[int] = None,
+        limit: int = 500,
+        sort_by: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List all stages, following pagination cursors.
+
+        Args:
+            pipeline_id: Filter stages for a specific pipeline
+            limit: Items per page (max 500)
+            sort_by: Field to sort by (id, update_time, add_time, order_nr)
+            sort_direction: Sort direction (asc, desc)
+
+        Returns:
+            List of all stage dicts
+        """
+        stages: List[Dict[str, Any]] = []
+        async for page in self.iter_stages(
+            pipeline_id=pipeline_id,
+            limit=limit,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+        ):
+            stages.extend(page)
+        return stages
+
     async def get_stage(self, stage_id: int) -> Dict[str, Any]:
         """
         Get a single stage by ID.
 
+        Concurrent lookups are coalesced into a single list request.
+
         Args:
             stage_id: The ID of the stage
 
         Returns:
             Dictionary containing stage data
         """
-        logger.info(f"PipelineClient: Fetching stage with ID {stage_id}")
+        cache_key = ("get_stage", stage_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("PipelineClient: Returning cached stage %s", stage_id)
+            return cached
 
-        response_data = await self.base_client.request(
-            "GET", f"/stages/{stage_id}"
-        )
+        logger.info("PipelineClient: Fetching stage with ID %s", stage_id)
 
-        stage_data = response_data.get("data", {})
-        logger.info(f"PipelineClient: Successfully retrieved stage {stage_id}")
+        stage_data = await self._stage_loader.load(stage_id)
+        logger.info("PipelineClient: Successfully retrieved stage %s", stage_id)
+        if stage_data:
+            self._cache_set(cache_key, stage_data)
         return stage_data
@@ -1,7 +1,12 @@
+import asyncio
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
+from pipedrive.api.base_client import BaseClient
 from pipedrive.api.features.pipelines.client.pipeline_client import PipelineClient
+from pipedrive.api.pipedrive_api_error import PipedriveAPIError
 
 
 @pytest.mark.asyncio
@@ -25,7 +30,7 @@ class TestPipelineClient:
         pipelines, next_cursor = await self.client.list_pipelines(limit=50)
 
         self.base_client.request.assert_called_once_with(
-            "GET", "/pipelines", query_params={"limit": 50}
+            "GET", "/pipelines", query_params={"limit": 50}, revalidate=True
         )
         assert len(pipelines) == 2
         assert pipelines[0]["name"] == "Sales Pipeline"
@@ -46,6 +51,7 @@ class TestPipelineClient:
             "GET",
             "/pipelines",
             query_params={"limit": 100, "sort_by": "id", "sort_direction": "desc"},
+            revalidate=True,
         )
         assert len(pipelines) == 2
         assert next_cursor is None
@@ -62,6 +68,18 @@ class TestPipelineClient:
         assert pipelines == []
         assert next_cursor is None
 
+    async def test_list_stages_null_additional_data(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [{"id": 1, "name": "Qualified"}],
+            "additional_data": None,
+        }
+
+        stages, next_cursor = await self.client.list_stages()
+
+        assert len(stages) == 1
+        assert next_cursor is None
+
     async def test_get_pipeline(self):
         self.base_client.request.return_value = {
             "success": True,
@@ -76,7 +94,7 @@ class TestPipelineClient:
         result = await self.client.get_pipeline(pipeline_id=1)
 
         self.base_client.request.assert_called_once_with(
-            "GET", "/pipelines/1"
+            "GET", "/pipelines/1", revalidate=True
         )
         assert result["id"] == 1
         assert result["name"] == "Sales Pipeline"
@@ -97,6 +115,7 @@ class TestPipelineClient:
             "GET",
             "/stages",
             query_params={"limit": 100, "pipeline_id": 1},
+            revalidate=True,
         )
         assert len(stages) == 2
         assert stages[0]["name"] == "Qualified"
@@ -115,7 +134,7 @@ class TestPipelineClient:
         stages, next_cursor = await self.client.list_stages()
 
         self.base_client.request.assert_called_once_with(
-            "GET", "/stages", query_params={"limit": 100}
+            "GET", "/stages", query_params={"limit": 100}, revalidate=True
         )
         assert len(stages) == 2
 
@@ -139,6 +158,7 @@ class TestPipelineClient:
                 "sort_by": "order_nr",
                 "sort_direction": "asc",
             },
+            revalidate=True,
         )
 
     async def test_get_stage(self):
@@ -157,8 +177,294 @@ class TestPipelineClient:
         result = await self.client.get_stage(stage_id=3)
 
         self.base_client.request.assert_called_once_with(
-            "GET", "/stages/3"
+            "GET", "/stages/3", revalidate=True
         )
         assert result["id"] == 3
         assert result["name"] == "Negotiation"
         assert result["pipeline_id"] == 1
+
+    async def test_list_pipelines_served_from_cache(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [{"id": 1, "name": "Sales Pipeline"}],
+            "additional_data": {"next_cursor": "abc123"},
+        }
+
+        first = await self.client.list_pipelines(limit=50)
+        second = await self.client.list_pipelines(limit=50)
+
+        self.base_client.request.assert_called_once()
+        assert second == first
+
+    async def test_cache_key_includes_arguments(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [{"id": 1, "name": "Qualified"}],
+            "additional_data": {},
+        }
+
+        await self.client.list_stages(pipeline_id=1)
+        await self.client.list_stages(pipeline_id=1, cursor="next")
+        await self.client.list_stages(pipeline_id=2)
+
+        assert self.base_client.request.call_count == 3
+
+    async def test_get_stage_cache_expires(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": {"id": 3, "name": "Negotiation"},
+        }
+        client = PipelineClient(self.base_client, cache_ttl=60)
+
+        with patch(
+            "pipedrive.api.features.pipelines.client.pipeline_client.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 1000.0
+            await client.get_stage(stage_id=3)
+            mock_monotonic.return_value = 1059.0
+            await client.get_stage(stage_id=3)
+            assert self.base_client.request.call_count == 1
+
+            mock_monotonic.return_value = 1060.0
+            await client.get_stage(stage_id=3)
+            assert self.base_client.request.call_count == 2
+
+    async def test_empty_get_response_not_cached(self):
+        self.base_client.request.return_value = {"success": True, "data": None}
+
+        await self.client.get_pipeline(pipeline_id=99)
+        await self.client.get_pipeline(pipeline_id=99)
+
+        assert self.base_client.request.call_count == 2
+
+    async def test_cache_disabled_with_zero_ttl(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": {"id": 1, "name": "Sales Pipeline"},
+        }
+        client = PipelineClient(self.base_client, cache_ttl=0)
+
+        await client.get_pipeline(pipeline_id=1)
+        await client.get_pipeline(pipeline_id=1)
+
+        assert self.base_client.request.call_count == 2
+
+    async def test_cache_evicts_oldest_entry_when_full(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": {"id": 1, "name": "Stage"},
+        }
+        client = PipelineClient(self.base_client, cache_size=2)
+
+        await client.get_stage(stage_id=1)
+        await client.get_stage(stage_id=2)
+        await client.get_stage(stage_id=3)
+        await client.get_stage(stage_id=2)
+        assert self.base_client.request.call_count == 3
+
+        await client.get_stage(stage_id=1)
+        assert self.base_client.request.call_count == 4
+
+    async def test_clear_cache(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": {"id": 1, "name": "Sales Pipeline"},
+        }
+
+        await self.client.get_pipeline(pipeline_id=1)
+        self.client.clear_cache()
+        await self.client.get_pipeline(pipeline_id=1)
+
+        assert self.base_client.request.call_count == 2
+
+    async def test_concurrent_get_stage_coalesced_into_list(self):
+        self.client.BATCH_THRESHOLD = 1
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [
+                {"id": 1, "name": "Qualified"},
+                {"id": 2, "name": "Proposal"},
+                {"id": 3, "name": "Negotiation"},
+            ],
+            "additional_data": {},
+        }
+
+        results = await asyncio.gather(
+            self.client.get_stage(stage_id=1),
+            self.client.get_stage(stage_id=3),
+            self.client.get_stage(stage_id=1),
+        )
+
+        self.base_client.request.assert_called_once_with(
+            "GET", "/stages", query_params={"limit": 500}, revalidate=True
+        )
+        assert [stage["name"] for stage in results] == [
+            "Qualified",
+            "Negotiation",
+            "Qualified",
+        ]
+
+    async def test_few_concurrent_get_stage_sent_individually(self):
+        self.base_client.request.side_effect = [
+            {"success": True, "data": {"id": 1, "name": "Qualified"}},
+            {"success": True, "data": {"id": 3, "name": "Negotiation"}},
+        ]
+
+        first, second = await asyncio.gather(
+            self.client.get_stage(stage_id=1),
+            self.client.get_stage(stage_id=3),
+        )
+
+        assert first["name"] == "Qualified"
+        assert second["name"] == "Negotiation"
+        assert [call.args for call in self.base_client.request.call_args_list] == [
+            ("GET", "/stages/1"),
+            ("GET", "/stages/3"),
+        ]
+
+    async def test_coalesced_get_pipeline_falls_back_for_missing_ids(self):
+        self.client.BATCH_THRESHOLD = 1
+        self.base_client.request.side_effect = [
+            {
+                "success": True,
+                "data": [{"id": 1, "name": "Sales Pipeline"}],
+                "additional_data": {"next_cursor": "more"},
+            },
+            {"success": True, "data": {"id": 7, "name": "Support Pipeline"}},
+        ]
+
+        sales, support = await asyncio.gather(
+            self.client.get_pipeline(pipeline_id=1),
+            self.client.get_pipeline(pipeline_id=7),
+        )
+
+        assert sales["name"] == "Sales Pipeline"
+        assert support["name"] == "Support Pipeline"
+        assert self.base_client.request.call_args_list[1].args == (
+            "GET",
+            "/pipelines/7",
+        )
+
+    async def test_coalesced_get_stage_error_only_affects_its_id(self):
+        self.client.BATCH_THRESHOLD = 1
+        self.base_client.request.side_effect = [
+            {"success": True, "data": [{"id": 1, "name": "Qualified"}]},
+            PipedriveAPIError("HTTP error 404: Not found", status_code=404),
+        ]
+
+        found, missing = await asyncio.gather(
+            self.client.get_stage(stage_id=1),
+            self.client.get_stage(stage_id=404),
+            return_exceptions=True,
+        )
+
+        assert found["name"] == "Qualified"
+        assert isinstance(missing, PipedriveAPIError)
+
+    async def test_list_all_pipelines_follows_cursors(self):
+        self.base_client.request.side_effect = [
+            {
+                "success": True,
+                "data": [{"id": 1}, {"id": 2}],
+                "additional_data": {"next_cursor": "page2"},
+            },
+            {
+                "success": True,
+                "data": [{"id": 3}],
+                "additional_data": {"next_cursor": None},
+            },
+        ]
+
+        pipelines = await self.client.list_all_pipelines(limit=2, sort_by="id")
+
+        assert [pipeline["id"] for pipeline in pipelines] == [1, 2, 3]
+        assert self.base_client.request.call_args_list[1].kwargs == {
+            "query_params": {"limit": 2, "cursor": "page2", "sort_by": "id"},
+            "revalidate": True,
+        }
+
+    async def test_iter_stages_prefetches_next_page(self):
+        self.base_client.request.side_effect = [
+            {
+                "success": True,
+                "data": [{"id": 1}],
+                "additional_data": {"next_cursor": "page2"},
+            },
+            {"success": True, "data": [{"id": 2}], "additional_data": {}},
+        ]
+
+        pages = self.client.iter_stages(pipeline_id=1)
+        first_page = await pages.__anext__()
+        # Let the prefetch task run before asking for page two
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert first_page == [{"id": 1}]
+        assert self.base_client.request.call_count == 2
+        assert [page async for page in pages] == [[{"id": 2}]]
+
+    async def test_iter_stages_cancels_prefetch_when_closed_early(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [{"id": 1}],
+            "additional_data": {"next_cursor": "page2"},
+        }
+
+        pages = self.client.iter_stages()
+        await pages.__anext__()
+        await pages.aclose()
+
+        assert self.base_client.request.call_count == 1
+
+    async def test_concurrent_list_stages_share_one_request(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "data": [{"id": 1, "name": "Qualified"}],
+                    "additional_data": {},
+                },
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = PipelineClient(BaseClient("token", "test", http))
+            first, second = await asyncio.gather(
+                client.list_stages(pipeline_id=1),
+                client.list_stages(pipeline_id=1),
+            )
+
+        assert len(requests) == 1
+        assert first == second
+
+    async def test_list_pipelines_warms_get_pipeline_cache(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [
+                {"id": 1, "name": "Sales Pipeline"},
+                {"id": 2, "name": "Support Pipeline"},
+            ],
+            "additional_data": {},
+        }
+
+        await self.client.list_pipelines()
+        result = await self.client.get_pipeline(pipeline_id=2)
+
+        self.base_client.request.assert_called_once()
+        assert result["name"] == "Support Pipeline"
+
+    async def test_list_stages_warms_get_stage_cache(self):
+        self.base_client.request.return_value = {
+            "success": True,
+            "data": [{"id": 3, "name": "Negotiation", "pipeline_id": 1}],
+            "additional_data": {},
+        }
+
+        await self.client.list_stages(pipeline_id=1)
+        result = await self.client.get_stage(stage_id=3)
+
+        self.base_client.request.assert_called_once()
+        assert result["name"] == "Negotiation"
@@ -2,11 +2,16 @@ from mcp.server.fastmcp import Context
 
 from log_config import logger
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import (
+    format_tool_response,
+    get_pipedrive_client,
+)
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from pipedrive.api.features.tool_decorator import tool
 
+# Static error response, encoded once at import
+_ID_REQUIRED_RESPONSE = format_tool_response(False, error_message="Pipeline ID is required")
+
 
 @tool("pipelines")
 async def get_pipeline_from_pipedrive(
@@ -34,19 +39,18 @@ async def get_pipeline_from_pipedrive(
         id, name, order_nr, is_deal_probability_enabled, add_time, update_time.
     """
     logger.debug(
-        f"Tool 'get_pipeline_from_pipedrive' ENTERED with raw args: id_str='{id_str}'"
+        "Tool 'get_pipeline_from_pipedrive' ENTERED with raw args: id_str='%s'", id_str
     )
 
     if not id_str:
-        return format_tool_response(False, error_message="Pipeline ID is required")
+        return _ID_REQUIRED_RESPONSE
 
     pipeline_id, id_error = convert_id_string(id_str, "pipeline_id")
     if id_error:
         return format_tool_response(False, error_message=id_error)
 
     try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
+        client = get_pipedrive_client(ctx)
 
         pipeline_data = await client.pipelines.get_pipeline(pipeline_id=pipeline_id)
 
@@ -55,16 +59,16 @@ async def get_pipeline_from_pipedrive(
                 False, error_message=f"Pipeline with ID {pipeline_id} not found"
             )
 
-        logger.info(f"Successfully retrieved pipeline with ID: {pipeline_id}")
+        logger.info("Successfully retrieved pipeline with ID: %s", pipeline_id)
         return format_tool_response(True, data=pipeline_data)
 
     except PipedriveAPIError as e:
         logger.error(
-            f"PipedriveAPIError in 'get_pipeline_from_pipedrive' for ID {pipeline_id}: {str(e)}"
+            "PipedriveAPIError in 'get_pipeline_from_pipedrive' for ID %s: %s", pipeline_id, e
         )
         return format_tool_response(False, error_message=str(e), data=e.response_data)
     except Exception as e:
         logger.exception(
-            f"Unexpected error in 'get_pipeline_from_pipedrive' for ID {pipeline_id}: {str(e)}"
+            "Unexpected error in 'get_pipeline_from_pipedrive' for ID %s: %s", pipeline_id, e
         )
         return format_tool_response(False, error_message=f"An unexpected error occurred: {str(e)}")
@@ -1,14 +1,20 @@
+import logging
 from typing import Optional
 
 from mcp.server.fastmcp import Context
 
 from log_config import logger
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
-from pipedrive.api.features.shared.utils import format_tool_response
+from pipedrive.api.features.shared.utils import (
+    format_tool_response,
+    get_pipedrive_client,
+)
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from pipedrive.api.features.tool_decorator import tool
 
+_PIPELINE_SORT_FIELDS = frozenset({"id", "update_time", "add_time"})
+_SORT_DIRECTIONS = frozenset({"asc", "desc"})
+
 
 @tool("pipelines")
 async def list_pipelines_from_pipedrive(
@@ -17,6 +23,7 @@ async def list_pipelines_from_pipedrive(
     cursor: Optional[str] = None,
     sort_by: Optional[str] = None,
     sort_direction: Optional[str] = None,
+    fetch_all: Optional[str] = None,
 ) -> str:
     """Lists all pipelines from the Pipedrive CRM.
 
@@ -28,6 +35,7 @@ async def list_pipelines_from_pipedrive(
         - cursor: Pagination cursor from a previous response's next_cursor field
         - sort_by: Field to sort by - "id", "update_time", or "add_time"
         - sort_direction: Sort direction - "asc" or "desc"
+        - fetch_all: "true" to follow pagination and return every page (default: "false")
 
     Example:
         list_pipelines_from_pipedrive()
@@ -38,22 +46,26 @@ async def list_pipelines_from_pipedrive(
         cursor: Pagination cursor for fetching the next page
         sort_by: Field to sort results by
         sort_direction: Direction to sort results
+        fetch_all: When "true", return all pipelines instead of a single page; limit
+            then sets the page size and cursor is ignored
 
     Returns:
         JSON string containing success status and a list of pipelines with fields:
         id, name, order_nr, is_deal_probability_enabled, add_time, update_time.
         Includes next_cursor for pagination if more results exist.
     """
-    logger.debug(
-        f"Tool 'list_pipelines_from_pipedrive' ENTERED with raw args: "
-        f"limit='{limit}', cursor='{cursor}', sort_by='{sort_by}', sort_direction='{sort_direction}'"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Tool 'list_pipelines_from_pipedrive' ENTERED with raw args: "
+            f"limit='{limit}', cursor='{cursor}', sort_by='{sort_by}', sort_direction='{sort_direction}', fetch_all='{fetch_all}'"
+        )
 
     # Sanitize
-    limit = None if limit == "" else limit
-    cursor = None if cursor == "" else cursor
-    sort_by = None if sort_by == "" else sort_by
-    sort_direction = None if sort_direction == "" else sort_direction
+    limit = limit or None
+    cursor = cursor or None
+    sort_by = sort_by or None
+    sort_direction = sort_direction or None
+    fetch_all = fetch_all or None
 
     # Convert limit
     limit_int = 100
@@ -64,37 +76,52 @@ async def list_pipelines_from_pipedrive(
         limit_int = min(limit_id, 500)
 
     # Validate sort_by
-    if sort_by and sort_by not in ("id", "update_time", "add_time"):
+    if sort_by and sort_by not in _PIPELINE_SORT_FIELDS:
         return format_tool_response(
             False,
-            error_message=f"Invalid sort_by value: '{sort_by}'. Must be one of: id, update_time, add_time",
+            error_message=f"Invalid sort_by value: '{sort_by}'. Must be one of: {', '.join(sorted(_PIPELINE_SORT_FIELDS))}",
         )
 
     # Validate sort_direction
-    if sort_direction and sort_direction not in ("asc", "desc"):
+    if sort_direction and sort_direction not in _SORT_DIRECTIONS:
         return format_tool_response(
             False,
             error_message=f"Invalid sort_direction: '{sort_direction}'. Must be 'asc' or 'desc'",
         )
 
-    try:
-        pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
-        client = pd_mcp_ctx.pipedrive_client
-
-        pipelines, next_cursor = await client.pipelines.list_pipelines(
-            limit=limit_int,
-            cursor=cursor,
-            sort_by=sort_by,
-            sort_direction=sort_direction,
+    # Validate fetch_all
+    if fetch_all and fetch_all.lower() not in ("true", "false"):
+        return format_tool_response(
+            False,
+            error_message=f"Invalid fetch_all value: '{fetch_all}'. Must be 'true' or 'false'",
         )
+    fetch_all_bool = fetch_all is not None and fetch_all.lower() == "true"
+
+    try:
+        client = get_pipedrive_client(ctx)
+
+        if fetch_all_bool:
+            pipelines = await client.pipelines.list_all_pipelines(
+                limit=limit_int,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            )
+            next_cursor = None
+        else:
+            pipelines, next_cursor = await client.pipelines.list_pipelines(
+                limit=limit_int,
+                cursor=cursor,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            )
 
         result = {"pipelines": pipelines, "next_cursor": next_cursor}
-        logger.info(f"Successfully listed {len(pipelines)} pipelines")
+        logger.info("Successfully listed %d pipelines", len(pipelines))
         return format_tool_response(True, data=result)
 
     except PipedriveAPIError as e:
-        logger.error(f"PipedriveAPIError in 'list_pipelines_from_pipedrive': {str(e)}")
+        logger.error("PipedriveAPIError in 'list_pipelines_from_pipedrive': %s", e)
         return format_tool_response(False, error_message=str(e), data=e.response_data)
     except Exception as e:
-        logger.exception(f"Unexpected error in 'list_pipelines_from_pipedrive': {str(e)}")
+        logger.exception("Unexpected error in 'list_pipelines_from_pipedrive': %s", e)
         return format_tool_response(False, error_message=f"An unexpected error occurred: {str(e)}")
@@ -1,19 +1,93 @@
 import pytest
-from unittest.mock import patch
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_registry import registry
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="package", autouse=True)
 def enable_pipelines_feature():
     """
-    Fixture to enable the 'pipelines' feature for all tests in this module.
+    Fixture to enable the 'pipelines' feature for all tests in this package.
     """
-    with patch('pipedrive.api.features.tool_registry.registry.is_feature_enabled') as mock_is_enabled:
-        def side_effect(feature_id):
-            if feature_id == "pipelines":
-                return True
-            return registry.is_feature_enabled(feature_id)
+    is_feature_enabled = registry.is_feature_enabled
+
+    def side_effect(feature_id):
+        if feature_id == "pipelines":
+            return True
+        return is_feature_enabled(feature_id)
 
-        mock_is_enabled.side_effect = side_effect
+    with patch.object(registry, "is_feature_enabled", side_effect=side_effect):
         yield
+
+
+# Default client results, shared by every test. The tools only read them.
+PIPELINES = [
+    {"id": 1, "name": "Sales Pipeline", "order_nr": 1},
+    {"id": 2, "name": "Support Pipeline", "order_nr": 2},
+]
+ALL_PIPELINES = PIPELINES + [{"id": 3, "name": "Renewals Pipeline", "order_nr": 3}]
+PIPELINE = {
+    "id": 1,
+    "name": "Sales Pipeline",
+    "order_nr": 1,
+    "is_deal_probability_enabled": True,
+}
+STAGES = [
+    {"id": 1, "name": "Qualified", "pipeline_id": 1, "order_nr": 1},
+    {"id": 2, "name": "Proposal", "pipeline_id": 1, "order_nr": 2},
+]
+ALL_STAGES = STAGES + [{"id": 3, "name": "Negotiation", "pipeline_id": 1, "order_nr": 3}]
+STAGE = {
+    "id": 3,
+    "name": "Negotiation",
+    "pipeline_id": 1,
+    "order_nr": 3,
+    "deal_probability": 75,
+}
+
+
+def _configure_pipelines_client(pipelines_client):
+    """Set the default return values most tests rely on."""
+    pipelines_client.list_pipelines.return_value = (PIPELINES, None)
+    pipelines_client.list_all_pipelines.return_value = ALL_PIPELINES
+    pipelines_client.get_pipeline.return_value = PIPELINE
+    pipelines_client.list_stages.return_value = (STAGES, None)
+    pipelines_client.list_all_stages.return_value = ALL_STAGES
+    pipelines_client.get_stage.return_value = STAGE
+
+
+@pytest.fixture(scope="session")
+def mock_pipedrive_client():
+    """
+    Create the mock PipedriveClient once for the whole session.
+
+    reset_pipelines_client restores its defaults after every test.
+    """
+    client = MagicMock()
+    client.pipelines = AsyncMock()
+    _configure_pipelines_client(client.pipelines)
+    return client
+
+
+@pytest.fixture(scope="session")
+def mock_ctx(mock_pipedrive_client):
+    """Create a mock MCP context holding the shared client mock."""
+    ctx = MagicMock(spec=Context)
+    ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
+    return ctx
+
+
+@pytest.fixture
+def stub_pipelines_method(mock_pipedrive_client, stub_client_method):
+    """Stub a pipelines client method with a plain coroutine (see stub_client_method)."""
+    return partial(stub_client_method, mock_pipedrive_client.pipelines)
+
+
+@pytest.fixture(autouse=True)
+def reset_pipelines_client(mock_pipedrive_client):
+    """Clear calls and per-test overrides on the shared client mock."""
+    yield
+    mock_pipedrive_client.pipelines.reset_mock(return_value=True, side_effect=True)
+    _configure_pipelines_client(mock_pipedrive_client.pipelines)
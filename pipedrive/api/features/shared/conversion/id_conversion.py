@@ -1,14 +1,18 @@
 import re
 import uuid
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 from datetime import datetime, timedelta
 
 
+@lru_cache(maxsize=4096)
 def convert_id_string(id_str: Optional[str], field_name: str, 
                      example: str = "123") -> Tuple[Optional[int], Optional[str]]:
     """
     Convert a string ID to an integer, with improved error handling.
     
+    Results are memoized, since tools convert the same IDs over and over.
+    
     Args:
         id_str: String ID to convert
         field_name: Name of the field for error messages
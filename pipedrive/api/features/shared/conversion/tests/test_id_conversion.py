@@ -31,6 +31,16 @@ class TestConvertIdString:
         assert result is None
         assert error is None
 
+    def test_repeated_conversion_is_cached(self):
+        """Test that repeated conversions are served from the cache."""
+        convert_id_string.cache_clear()
+
+        first = convert_id_string("456", "test_field")
+        second = convert_id_string("456", "test_field")
+
+        assert first == second == (456, None)
+        assert convert_id_string.cache_info().hits == 1
+
     def test_non_numeric_id_conversion(self):
         """Test non-numeric ID string conversion."""
         result, error = convert_id_string("abc", "test_field")
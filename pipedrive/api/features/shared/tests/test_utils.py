@@ -1,34 +1,27 @@
 import json
 from datetime import date, datetime
+from unittest.mock import MagicMock
 
 import pytest
 
 from pipedrive.api.features.shared.utils import (
-    DateTimeEncoder,
     bool_to_lowercase_str,
     format_tool_response,
     format_validation_error,
+    get_pipedrive_client,
     safe_split_to_list,
     sanitize_inputs,
 )
 
 
-class TestDateTimeEncoder:
-    def test_datetime_encoding(self):
-        """Test date and datetime encoding."""
-        test_date = date(2025, 1, 15)
-        test_datetime = datetime(2025, 1, 15, 14, 30, 0)
+class TestGetPipedriveClient:
+    def test_returns_client_from_lifespan_context(self):
+        """Test the client is read from the lifespan context."""
+        ctx = MagicMock()
+        pipedrive_client = MagicMock()
+        ctx.request_context.lifespan_context.pipedrive_client = pipedrive_client
 
-        data = {"date": test_date, "datetime": test_datetime, "other": "string_value"}
-
-        json_str = json.dumps(data, cls=DateTimeEncoder)
-
-        # Parse it back to check the values
-        parsed = json.loads(json_str)
-
-        assert parsed["date"] == "2025-01-15"
-        assert parsed["datetime"] == "2025-01-15T14:30:00"
-        assert parsed["other"] == "string_value"
+        assert get_pipedrive_client(ctx) is pipedrive_client
 
 
 class TestFormatToolResponse:
@@ -67,6 +60,23 @@ class TestFormatToolResponse:
         assert parsed["success"] is True
         assert parsed["data"]["date"] == "2025-01-15"
 
+    def test_response_with_datetime_and_non_string_keys(self):
+        """Test formatting response with datetimes and integer dict keys."""
+        data = {"datetime": datetime(2025, 1, 15, 14, 30, 0), 1: "one"}
+        response = format_tool_response(True, data=data)
+
+        parsed = json.loads(response)
+
+        assert parsed["data"]["datetime"] == "2025-01-15T14:30:00"
+        assert parsed["data"]["1"] == "one"
+
+    def test_response_is_indented_string(self):
+        """Test the response is a pretty-printed string."""
+        response = format_tool_response(True, data={"id": 1})
+
+        assert isinstance(response, str)
+        assert response.startswith('{\n  "success": true')
+
 
 class TestFormatValidationError:
     def test_format_validation_error(self):
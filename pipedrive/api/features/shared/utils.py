@@ -1,14 +1,23 @@
-import json
-from typing import Any, Dict, List, Optional
-from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import orjson
+from mcp.server.fastmcp import Context
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that can handle dates and datetimes."""
-    def default(self, obj):
-        if isinstance(obj, (date, datetime)):
-            return obj.isoformat()
-        return super().default(obj)
+if TYPE_CHECKING:
+    from pipedrive.api.pipedrive_client import PipedriveClient
+
+
+def get_pipedrive_client(ctx: Context) -> "PipedriveClient":
+    """
+    Get the Pipedrive client from an MCP tool context.
+
+    Args:
+        ctx: The MCP context passed to the tool
+
+    Returns:
+        The PipedriveClient held by the server's lifespan context
+    """
+    return ctx.request_context.lifespan_context.pipedrive_client
 
 
 def format_tool_response(
@@ -25,11 +34,12 @@ def format_tool_response(
     Returns:
         JSON formatted string with success status and data or error
     """
-    return json.dumps(
-        {"success": success, "data": data, "error": error_message}, 
-        indent=2,
-        cls=DateTimeEncoder
-    )
+    # orjson serializes dates and datetimes natively as ISO 8601 strings.
+    # The MCP tool contract is str, so the bytes are decoded once here.
+    return orjson.dumps(
+        {"success": success, "data": data, "error": error_message},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
 
 def safe_split_to_list(comma_separated_string: Optional[str]) -> Optional[List[str]]:
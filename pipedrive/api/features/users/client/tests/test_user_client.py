@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from pipedrive.api.features.users.client.user_client import UserClient
+from pipedrive.api.pipedrive_api_error import PipedriveAPIError
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture(scope="module")
+def base_client():
+    """Create the mock BaseClient once for the module."""
+    return AsyncMock()
+
+
+@pytest.fixture(scope="module")
+def client(base_client):
+    """Create a UserClient sharing the module's mock BaseClient."""
+    return UserClient(base_client)
+
+
+@pytest.fixture(autouse=True)
+def reset_base_client(base_client):
+    """Clear calls and per-test overrides on the shared BaseClient mock."""
+    yield
+    base_client.reset_mock(return_value=True, side_effect=True)
+
+
+class TestUserClient:
+    """Tests for the UserClient"""
+
+    async def test_get_user(self, client, base_client):
+        base_client.request.return_value = {
+            "success": True,
+            "data": {"id": 42, "name": "Jane Smith", "email": "jane@example.com"},
+        }
+
+        user = await client.get_user(user_id=42)
+
+        base_client.request.assert_called_once_with("GET", "/users/42", version="v1")
+        assert user["id"] == 42
+        assert user["name"] == "Jane Smith"
+
+    async def test_get_user_missing_data(self, client, base_client):
+        base_client.request.return_value = {"success": True}
+
+        user = await client.get_user(user_id=42)
+
+        assert user == {}
+
+    async def test_get_user_api_error(self, client, base_client):
+        base_client.request.side_effect = PipedriveAPIError(
+            message="Not found", status_code=404
+        )
+
+        with pytest.raises(PipedriveAPIError):
+            await client.get_user(user_id=999)
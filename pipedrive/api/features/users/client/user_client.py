@@ -29,7 +29,7 @@ class UserClient:
         Raises:
             PipedriveAPIError: If the API request fails
         """
-        logger.info(f"UserClient: Fetching user with ID {user_id}")
+        logger.info("UserClient: Fetching user with ID %s", user_id)
 
         # Users API is only available on v1 endpoint
         response_data = await self.base_client.request(
@@ -39,6 +39,6 @@ class UserClient:
         )
 
         user_data = response_data.get("data", {})
-        logger.info(f"UserClient: Successfully retrieved user {user_id}")
+        logger.info("UserClient: Successfully retrieved user %s", user_id)
 
         return user_data
@@ -0,0 +1 @@
+"""Tests for user models."""
@@ -0,0 +1,52 @@
+"""Tests for User model."""
+import pytest
+from pydantic import ValidationError
+from pipedrive.api.features.users.models.user import User
+
+
+class TestUserModel:
+    """Tests for the User model."""
+
+    def test_from_api_response(self):
+        """Test creating a user from API data."""
+        user = User.from_api_response({
+            "id": 1,
+            "name": "Jane Doe",
+            "email": "jane@example.com",
+            "is_admin": True,
+            "lang": 1,
+        })
+        assert user.id == 1
+        assert user.name == "Jane Doe"
+        assert user.email == "jane@example.com"
+        assert user.active_flag is True
+        assert user.is_admin is True
+        assert user.role_id is None
+
+    def test_from_api_response_ignores_unknown_fields(self):
+        """Test that extra API fields are dropped."""
+        user = User.from_api_response({
+            "id": 1,
+            "name": "Jane Doe",
+            "email": "jane@example.com",
+            "locale": "en_US",
+            "access": [{"app": "sales"}],
+        })
+        assert "locale" not in user.model_dump()
+        assert not hasattr(user, "access")
+
+    def test_from_api_response_coerces_types(self):
+        """Test that string IDs from the API are coerced."""
+        user = User.from_api_response({
+            "id": "42",
+            "name": "Jane Doe",
+            "email": "jane@example.com",
+            "role_id": "3",
+        })
+        assert user.id == 42
+        assert user.role_id == 3
+
+    def test_from_api_response_missing_required_field(self):
+        """Test that missing required fields raise ValidationError."""
+        with pytest.raises(ValidationError):
+            User.from_api_response({"id": 1, "name": "Jane Doe"})
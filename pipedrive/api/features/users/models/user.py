@@ -39,7 +39,6 @@ class User(BaseModel):
         Returns:
             User instance with parsed data
         """
-        return cls(**{
-            k: v for k, v in api_data.items()
-            if k in cls.model_fields
-        })
+        # Unknown keys are ignored by the model, so the raw payload can be
+        # validated directly instead of being copied into a filtered dict
+        return cls.model_validate(api_data)
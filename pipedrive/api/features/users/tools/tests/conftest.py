@@ -1,22 +1,76 @@
 import pytest
-from unittest.mock import patch
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from mcp.server.fastmcp import Context
 from pipedrive.api.features.tool_registry import registry
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="package", autouse=True)
 def enable_users_feature():
     """
-    Fixture to enable the 'users' feature for all tests in this module.
+    Fixture to enable the 'users' feature for all tests in this package.
 
-    This fixture is automatically used in all tests in this directory.
+    The patch is applied once for the package rather than around every test.
     It ensures the 'users' feature is reported as enabled during tests.
     """
-    with patch('pipedrive.api.features.tool_registry.registry.is_feature_enabled') as mock_is_enabled:
-        def side_effect(feature_id):
-            if feature_id == "users":
-                return True
-            return registry.is_feature_enabled(feature_id)
+    is_feature_enabled = registry.is_feature_enabled
+
+    def side_effect(feature_id):
+        if feature_id == "users":
+            return True
+        return is_feature_enabled(feature_id)
 
-        mock_is_enabled.side_effect = side_effect
+    with patch.object(registry, "is_feature_enabled", side_effect=side_effect):
         yield
+
+
+# Default get_user result, shared by every test. The tool only reads it.
+USER = {
+    "id": 42,
+    "name": "Jane Smith",
+    "email": "jane@example.com",
+    "active_flag": True,
+    "role_id": 1,
+    "icon_url": None,
+}
+
+
+def _configure_users_client(users_client):
+    """Set the default return values most tests rely on."""
+    users_client.get_user.return_value = USER
+
+
+@pytest.fixture(scope="session")
+def mock_pipedrive_client():
+    """
+    Create a mock PipedriveClient once for the whole session.
+
+    reset_users_client restores its defaults after every test.
+    """
+    client = MagicMock()
+    client.users = AsyncMock()
+    _configure_users_client(client.users)
+    return client
+
+
+@pytest.fixture(scope="session")
+def mock_ctx(mock_pipedrive_client):
+    """Create a mock MCP context holding the shared client mock."""
+    ctx = MagicMock(spec=Context)
+    ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
+    return ctx
+
+
+@pytest.fixture
+def stub_users_method(mock_pipedrive_client, stub_client_method):
+    """Stub a users client method with a plain coroutine (see stub_client_method)."""
+    return partial(stub_client_method, mock_pipedrive_client.users)
+
+
+@pytest.fixture(autouse=True)
+def reset_users_client(mock_pipedrive_client):
+    """Clear calls and per-test overrides on the shared client mock."""
+    yield
+    mock_pipedrive_client.users.reset_mock(return_value=True, side_effect=True)
+    _configure_users_client(mock_pipedrive_client.users)
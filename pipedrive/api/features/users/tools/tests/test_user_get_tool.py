@@ -1,45 +1,33 @@
-import json
+import orjson
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
-from mcp.server.fastmcp import Context
 from pipedrive.api.features.users.tools.user_get_tool import get_user_from_pipedrive
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
 
 
-@pytest.fixture
-def mock_pipedrive_client():
-    """Create a mock PipedriveClient for testing"""
-    users_client = AsyncMock()
+# Keep the module on one worker under --dist loadgroup (see test_pipeline_tools)
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.xdist_group("user_tools"),
+]
 
-    users_client.get_user.return_value = {
-        "id": 42,
-        "name": "Jane Smith",
-        "email": "jane@example.com",
-        "active_flag": True,
-        "role_id": 1,
-        "icon_url": None,
-    }
-
-    client = MagicMock()
-    client.users = users_client
-
-    return client
+USER_NOT_FOUND_ERROR = PipedriveAPIError(
+    message="API Error",
+    status_code=404,
+    error_info="User not found",
+    response_data={"error": "The requested user does not exist"},
+)
 
 
 class TestGetUserTool:
-    @pytest.mark.asyncio
-    async def test_get_user_success(self, mock_pipedrive_client):
+    async def test_get_user_success(self, mock_ctx, mock_pipedrive_client):
         """Test successful user retrieval"""
-        mock_ctx = MagicMock(spec=Context)
-        mock_ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
-
         result = await get_user_from_pipedrive(
             ctx=mock_ctx,
             id_str="42",
         )
 
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is True
         assert result_data["data"]["id"] == 42
@@ -48,78 +36,52 @@ class TestGetUserTool:
 
         mock_pipedrive_client.users.get_user.assert_called_once_with(user_id=42)
 
-    @pytest.mark.asyncio
-    async def test_get_user_invalid_id(self, mock_pipedrive_client):
-        """Test error handling with invalid ID input"""
-        mock_ctx = MagicMock(spec=Context)
-        mock_ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
-
+    @pytest.mark.parametrize(
+        "id_str,err_substr",
+        [
+            ("not_a_number", "user_id must be a numeric string"),
+            ("", "User ID is required"),
+        ],
+    )
+    async def test_get_user_input_errors(
+        self, mock_ctx, mock_pipedrive_client, id_str, err_substr
+    ):
+        """Test error handling with invalid or empty ID input"""
         result = await get_user_from_pipedrive(
             ctx=mock_ctx,
-            id_str="not_a_number",
+            id_str=id_str,
         )
 
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
-        assert "user_id must be a numeric string" in result_data["error"]
+        assert err_substr in result_data["error"]
         mock_pipedrive_client.users.get_user.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_get_user_empty_id(self, mock_pipedrive_client):
-        """Test error handling with empty ID"""
-        mock_ctx = MagicMock(spec=Context)
-        mock_ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
-
-        result = await get_user_from_pipedrive(
-            ctx=mock_ctx,
-            id_str="",
-        )
-
-        result_data = json.loads(result)
-
-        assert result_data["success"] is False
-        assert "User ID is required" in result_data["error"]
-        mock_pipedrive_client.users.get_user.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_get_user_not_found(self, mock_pipedrive_client):
+    async def test_get_user_not_found(self, mock_ctx, stub_users_method):
         """Test handling when user is not found"""
-        mock_ctx = MagicMock(spec=Context)
-        mock_ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
-
-        mock_pipedrive_client.users.get_user.return_value = {}
+        stub_users_method("get_user", {})
 
         result = await get_user_from_pipedrive(
             ctx=mock_ctx,
             id_str="999",
         )
 
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "User with ID 999 not found" in result_data["error"]
 
-    @pytest.mark.asyncio
-    async def test_get_user_api_error(self, mock_pipedrive_client):
+    async def test_get_user_api_error(self, mock_ctx, mock_pipedrive_client):
         """Test handling of API errors"""
-        mock_ctx = MagicMock(spec=Context)
-        mock_ctx.request_context.lifespan_context.pipedrive_client = mock_pipedrive_client
-
-        api_error = PipedriveAPIError(
-            message="API Error",
-            status_code=404,
-            error_info="User not found",
-            response_data={"error": "The requested user does not exist"},
-        )
-        mock_pipedrive_client.users.get_user.side_effect = api_error
+        mock_pipedrive_client.users.get_user.side_effect = USER_NOT_FOUND_ERROR
 
         result = await get_user_from_pipedrive(
             ctx=mock_ctx,
             id_str="42",
         )
 
-        result_data = json.loads(result)
+        result_data = orjson.loads(result)
 
         assert result_data["success"] is False
         assert "API Error" in result_data["error"]
@@ -1,12 +1,14 @@
 from mcp.server.fastmcp import Context
 
 from log_config import logger
-from pipedrive.api.features.shared.utils import format_tool_response
 from pipedrive.api.features.shared.conversion.id_conversion import convert_id_string
+from pipedrive.api.features.shared.utils import format_tool_response, get_pipedrive_client
 from pipedrive.api.pipedrive_api_error import PipedriveAPIError
-from pipedrive.api.pipedrive_context import PipedriveMCPContext
 from pipedrive.api.features.tool_decorator import tool
 
+# Static error response, encoded once at import
+_ID_REQUIRED_RESPONSE = format_tool_response(False, error_message="User ID is required")
+
 
 @tool("users")
 async def get_user_from_pipedrive(
@@ -43,44 +45,40 @@ async def get_user_from_pipedrive(
         - icon_url: URL of the user's avatar
     """
     logger.debug(
-        f"Tool 'get_user_from_pipedrive' ENTERED with raw args: id_str='{id_str}'"
+        "Tool 'get_user_from_pipedrive' ENTERED with raw args: id_str='%s'", id_str
     )
 
     if not id_str:
-        error_msg = "User ID is required"
-        logger.error(error_msg)
-        return format_tool_response(False, error_message=error_msg)
-
-    pd_mcp_ctx: PipedriveMCPContext = ctx.request_context.lifespan_context
+        logger.error("User ID is required")
+        return _ID_REQUIRED_RESPONSE
 
     user_id, id_error = convert_id_string(id_str, "user_id")
     if id_error:
-        logger.error(id_error)
+        logger.error("%s", id_error)
         return format_tool_response(False, error_message=id_error)
 
     try:
-        user_data = await pd_mcp_ctx.pipedrive_client.users.get_user(
-            user_id=user_id,
-        )
+        client = get_pipedrive_client(ctx)
+
+        user_data = await client.users.get_user(user_id=user_id)
 
         if not user_data:
-            logger.warning(f"User with ID {user_id} not found")
+            logger.warning("User with ID %s not found", user_id)
             return format_tool_response(
                 False, error_message=f"User with ID {user_id} not found"
             )
 
-        logger.info(f"Successfully retrieved user with ID: {user_id}")
+        logger.info("Successfully retrieved user with ID: %s", user_id)
         return format_tool_response(True, data=user_data)
 
     except PipedriveAPIError as e:
         logger.error(
-            f"PipedriveAPIError in tool 'get_user_from_pipedrive' for ID {user_id}: {str(e)} - Response Data: {e.response_data}"
+            "PipedriveAPIError in 'get_user_from_pipedrive' for ID %s: %s - Response Data: %s",
+            user_id, e, e.response_data,
         )
         return format_tool_response(False, error_message=str(e), data=e.response_data)
     except Exception as e:
         logger.exception(
-            f"Unexpected error in tool 'get_user_from_pipedrive' for ID {user_id}: {str(e)}"
-        )
-        return format_tool_response(
-            False, error_message=f"An unexpected error occurred: {str(e)}"
+            "Unexpected error in 'get_user_from_pipedrive' for ID %s: %s", user_id, e
         )
+        return format_tool_response(False, error_message=f"An unexpected error occurred: {str(e)}")
@@ -1,7 +1,6 @@
 from pipedrive.api.features.tool_registry import registry, FeatureMetadata
-from pipedrive.api.features.users.tools.user_get_tool import get_user_from_pipedrive
 
-# Register the feature
+# Register the feature first (before tool imports trigger @tool decorator)
 registry.register_feature(
     "users",
     FeatureMetadata(
@@ -11,5 +10,7 @@ registry.register_feature(
     )
 )
 
+from pipedrive.api.features.users.tools.user_get_tool import get_user_from_pipedrive
+
 # Register all tools for this feature
 registry.register_tool("users", get_user_from_pipedrive)
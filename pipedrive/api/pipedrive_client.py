@@ -1,3 +1,6 @@
+import asyncio
+import inspect
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
@@ -35,22 +38,89 @@ class PipedriveClient:
             company_domain: Pipedrive company domain
             http_client: AsyncClient for HTTP requests
         """
-        # Initialize the base client
+        # Initialize the base client. Resource-specific clients are created
+        # on first access, since a session typically uses only a few of them.
         self.base_client = BaseClient(api_token, company_domain, http_client)
 
-        # Initialize resource-specific clients
-        self.persons = PersonClient(self.base_client)
-        self.deals = DealClient(self.base_client)
-        self.organizations = OrganizationClient(self.base_client)
-        self.item_search = ItemSearchClient(self.base_client)
-        self.lead_client = LeadClient(self.base_client)
-        self.activities = ActivityClient(self.base_client)
-        self.pipelines = PipelineClient(self.base_client)
-        self.users = UserClient(self.base_client)
-        self.notes = NoteClient(self.base_client)
-
         logger.debug("PipedriveClient initialized.")
 
+    # --- Resource-specific clients ---
+
+    @cached_property
+    def persons(self) -> PersonClient:
+        return PersonClient(self.base_client)
+
+    @cached_property
+    def deals(self) -> DealClient:
+        return DealClient(self.base_client)
+
+    @cached_property
+    def organizations(self) -> OrganizationClient:
+        return OrganizationClient(self.base_client)
+
+    @cached_property
+    def item_search(self) -> ItemSearchClient:
+        return ItemSearchClient(self.base_client)
+
+    @cached_property
+    def lead_client(self) -> LeadClient:
+        return LeadClient(self.base_client)
+
+    @cached_property
+    def activities(self) -> ActivityClient:
+        return ActivityClient(self.base_client)
+
+    @cached_property
+    def pipelines(self) -> PipelineClient:
+        return PipelineClient(self.base_client)
+
+    @cached_property
+    def users(self) -> UserClient:
+        return UserClient(self.base_client)
+
+    @cached_property
+    def notes(self) -> NoteClient:
+        return NoteClient(self.base_client)
+
+    def invalidate_reference_caches(self) -> None:
+        """
+        Drop cached reference data: pipelines, stages, lead labels and sources.
+
+        Call this when the data is known to have changed, e.g. from a webhook.
+        Clients that haven't been created yet have nothing cached.
+        """
+        for name in ("pipelines", "lead_client"):
+            client = self.__dict__.get(name)
+            if client is not None:
+                client.clear_cache()
+
+    async def batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run several client methods concurrently.
+
+        Args:
+            calls: (method_name, kwargs) pairs naming forwarding methods of
+                this client, e.g. [("get_deal", {"deal_id": 1})]
+
+        Returns:
+            Results in the same order as calls. A call that failed yields its
+            exception instead of raising, so one error doesn't lose the rest.
+
+        Raises:
+            ValueError: If a name is not a public async method of the client
+        """
+        methods = []
+        for name, _ in calls:
+            method = None if name.startswith("_") else getattr(self, name, None)
+            if name == "batch" or not inspect.iscoroutinefunction(method):
+                raise ValueError(f"Unknown PipedriveClient method for batch: {name}")
+            methods.append(method)
+
+        return await asyncio.gather(
+            *(method(**kwargs) for method, (_, kwargs) in zip(methods, calls)),
+            return_exceptions=True,
+        )
+
     # --- Person Methods (forwarding to persons client) ---
 
     async def create_person(
@@ -9,8 +9,22 @@ from log_config import logger
 from pipedrive.api.pipedrive_client import PipedriveClient
 from pipedrive.pipedrive_config import settings
 
+# One pooled client serves every request for the lifetime of the server, so
+# TCP/TLS connections are kept alive and HTTP/2 multiplexes concurrent calls.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=60
+)
+# Opening a connection to Pipedrive should never take long, so fail fast on
+# connect rather than waiting out the full request timeout
+HTTP_CONNECT_TIMEOUT = 5.0
 
-@dataclass
+
+def build_http_timeout(timeout: float) -> httpx.Timeout:
+    """Build the client timeout from the configured request timeout in seconds."""
+    return httpx.Timeout(timeout, connect=min(timeout, HTTP_CONNECT_TIMEOUT))
+
+
+@dataclass(slots=True)
 class PipedriveMCPContext:
     pipedrive_client: PipedriveClient
 
@@ -23,7 +37,12 @@ async def pipedrive_lifespan(server: FastMCP) -> AsyncIterator[PipedriveMCPConte
     if not settings.verify_ssl:
         logger.warning("SSL verification is disabled. This should only be used in development environments.")
 
-    async with httpx.AsyncClient(timeout=settings.timeout, verify=settings.verify_ssl) as client:
+    async with httpx.AsyncClient(
+        timeout=build_http_timeout(settings.timeout),
+        verify=settings.verify_ssl,
+        limits=HTTP_LIMITS,
+        http2=True,
+    ) as client:
         pd_client = PipedriveClient(
             api_token=settings.api_token,
             company_domain=settings.company_domain,
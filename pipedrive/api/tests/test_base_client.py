@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
@@ -16,7 +18,7 @@ def mock_http_client():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.text = '{"success":true,"data":{"id":123,"name":"Test"}}'
-    mock_response.json.return_value = {"success": True, "data": {"id": 123, "name": "Test"}}
+    mock_response.content = b'{"success":true,"data":{"id":123,"name":"Test"}}'
     client.request.return_value = mock_response
     
     return client
@@ -177,11 +179,7 @@ class TestBaseClient:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = '{"success":false,"error":"API Error","error_info":"Additional info"}'
-        mock_response.json.return_value = {
-            "success": False,
-            "error": "API Error",
-            "error_info": "Additional info"
-        }
+        mock_response.content = mock_response.text.encode()
         mock_http_client.request.return_value = mock_response
 
         client = BaseClient(
@@ -227,4 +225,220 @@ class TestBaseClient:
         
         # Check exception details
         assert "404" in str(exc_info.value)
-        assert exc_info.value.status_code == 404
\ No newline at end of file
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_request_revalidate_reuses_response_on_304(self, mock_http_client):
+        """Test conditional GET with ETag/If-None-Match"""
+        request = httpx.Request("GET", "https://test.pipedrive.com/api/v2/stages")
+        payload = {"success": True, "data": [{"id": 1, "name": "Qualified"}]}
+        mock_http_client.request.side_effect = [
+            httpx.Response(200, json=payload, headers={"ETag": '"v1"'}, request=request),
+            httpx.Response(304, request=request),
+        ]
+
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        first = await client.request("GET", "/stages", query_params={"limit": 100}, revalidate=True)
+        second = await client.request("GET", "/stages", query_params={"limit": 100}, revalidate=True)
+
+        assert first == payload
+        assert second == payload
+        first_call, second_call = mock_http_client.request.call_args_list
+        assert "If-None-Match" not in first_call.kwargs["headers"]
+        assert second_call.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_request_revalidate_304_result_isolated_from_first(self, mock_http_client):
+        """Test that changing the first result doesn't leak into a later 304 result"""
+        request = httpx.Request("GET", "https://test.pipedrive.com/api/v2/stages")
+        payload = {"success": True, "data": [{"id": 1, "name": "Qualified"}]}
+        mock_http_client.request.side_effect = [
+            httpx.Response(200, json=payload, headers={"ETag": '"v1"'}, request=request),
+            httpx.Response(304, request=request),
+            httpx.Response(304, request=request),
+        ]
+
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        first = await client.request("GET", "/stages", revalidate=True)
+        first["data"][0]["name"] = "Changed"
+        first["data"].append({"id": 2})
+        second = await client.request("GET", "/stages", revalidate=True)
+        second["data"].clear()
+        third = await client.request("GET", "/stages", revalidate=True)
+
+        assert third == payload
+
+    @pytest.mark.asyncio
+    async def test_request_revalidate_without_etag(self, mock_http_client):
+        """Test that responses without an ETag are not revalidated"""
+        request = httpx.Request("GET", "https://test.pipedrive.com/api/v2/stages/1")
+        payload = {"success": True, "data": {"id": 1}}
+        mock_http_client.request.side_effect = [
+            httpx.Response(200, json=payload, request=request),
+            httpx.Response(200, json=payload, request=request),
+        ]
+
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        await client.request("GET", "/stages/1", revalidate=True)
+        await client.request("GET", "/stages/1", revalidate=True)
+
+        second_call = mock_http_client.request.call_args_list[1]
+        assert "If-None-Match" not in second_call.kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_request_skips_debug_dumps_when_debug_disabled(self, mock_http_client):
+        """Test that JSON log dumps are only built when debug logging is enabled"""
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        with patch("pipedrive.api.base_client.logger.isEnabledFor", return_value=False), \
+                patch("pipedrive.api.base_client._format_json_for_log") as mock_format:
+            result = await client.request("POST", "/test", json_payload={"field1": "value1"})
+
+        assert result == {"success": True, "data": {"id": 123, "name": "Test"}}
+        mock_format.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_request_coalesces_concurrent_identical_gets(self, mock_http_client):
+        """Test that concurrent identical GETs share one HTTP request"""
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        first, second = await asyncio.gather(
+            client.request("GET", "/persons/1", query_params={"include_fields": None}),
+            client.request("GET", "/persons/1"),
+        )
+
+        assert first == second == {"success": True, "data": {"id": 123, "name": "Test"}}
+        mock_http_client.request.assert_called_once()
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_request_coalesced_callers_get_isolated_results(self, mock_http_client):
+        """Test that a caller mutating a shared GET result doesn't affect the others"""
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        async def get_and_mutate():
+            result = await client.request("GET", "/persons/1")
+            result["data"]["name"] = "Changed"
+            return result
+
+        mutated, untouched = await asyncio.gather(
+            get_and_mutate(),
+            client.request("GET", "/persons/1"),
+        )
+
+        mock_http_client.request.assert_called_once()
+        assert mutated["data"]["name"] == "Changed"
+        assert untouched == {"success": True, "data": {"id": 123, "name": "Test"}}
+        assert untouched["data"] is not mutated["data"]
+
+    @pytest.mark.asyncio
+    async def test_request_does_not_join_finished_inflight_request(self, mock_http_client):
+        """Test that a finished request still awaiting removal is not shared"""
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+        first = asyncio.ensure_future(client.request("GET", "/persons/1"))
+        await asyncio.sleep(0)
+        key, inflight = next(iter(client._inflight.items()))
+        first_result = await first
+        # Simulate a caller arriving before the done callback has run
+        client._inflight[key] = inflight
+        result = await client.request("GET", "/persons/1")
+
+        assert mock_http_client.request.call_count == 2
+        assert inflight.callers == 1
+        assert result is not first_result
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_request_error_retrieved_when_all_callers_cancelled(self, mock_http_client):
+        """Test that a failed GET whose callers were all cancelled doesn't warn"""
+        release = asyncio.Event()
+
+        async def fail(*args, **kwargs):
+            await release.wait()
+            raise httpx.ConnectError("boom")
+
+        mock_http_client.request.side_effect = fail
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        caller = asyncio.ensure_future(client.request("GET", "/deals/1"))
+        await asyncio.sleep(0)
+        task = next(iter(client._inflight.values())).task
+        caller.cancel()
+        release.set()
+        await asyncio.wait([task])
+        await asyncio.sleep(0)
+
+        assert client._inflight == {}
+        assert task._log_traceback is False
+
+    @pytest.mark.asyncio
+    async def test_request_does_not_coalesce_different_or_unsafe_requests(self, mock_http_client):
+        """Test that GETs with different params and non-GET requests are sent separately"""
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        await asyncio.gather(
+            client.request("GET", "/persons", query_params={"limit": 1}),
+            client.request("GET", "/persons", query_params={"limit": 2}),
+            client.request("POST", "/persons", json_payload={"name": "A"}),
+            client.request("POST", "/persons", json_payload={"name": "A"}),
+        )
+
+        assert mock_http_client.request.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_request_coalesced_error_reaches_every_caller(self, mock_http_client):
+        """Test that a failed shared GET raises for all waiting callers"""
+        mock_http_client.request.side_effect = httpx.ConnectError("boom")
+        client = BaseClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        results = await asyncio.gather(
+            client.request("GET", "/deals/1"),
+            client.request("GET", "/deals/1"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, PipedriveAPIError) for result in results)
+        mock_http_client.request.assert_called_once()
@@ -39,12 +39,16 @@ class TestPipedriveClient:
                     "test_token", "test", mock_http_client
                 )
                 
-                # Check that person client was initialized correctly
-                mock_person_client_class.assert_called_once_with(mock_base_client)
+                # Resource clients are created on first access
+                mock_person_client_class.assert_not_called()
                 
                 # Check client attributes
                 assert client.base_client == mock_base_client
                 assert client.persons == mock_person_client
+                
+                # Check that person client was initialized correctly, once
+                assert client.persons is client.persons
+                mock_person_client_class.assert_called_once_with(mock_base_client)
     
     @pytest.mark.asyncio
     async def test_create_person_delegates_to_persons_client(self, mock_http_client):
@@ -217,4 +221,55 @@ class TestPipedriveClient:
             custom_fields_keys=None,
             updated_since=None,
             updated_until=None
-        )
\ No newline at end of file
+        )
+
+    def test_invalidate_reference_caches(self, mock_http_client):
+        """Test that reference caches are cleared on the clients already created"""
+        client = PipedriveClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+        client.pipelines = MagicMock()
+
+        client.invalidate_reference_caches()
+
+        client.pipelines.clear_cache.assert_called_once_with()
+        assert "lead_client" not in vars(client)
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_calls_in_order(self, mock_http_client):
+        """Test that batch returns each call's result or exception in order"""
+        client = PipedriveClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+        mock_persons_client = AsyncMock(spec=PersonClient)
+        mock_persons_client.get_person.return_value = {"id": 1}
+        mock_persons_client.delete_person.side_effect = ValueError("boom")
+        client.persons = mock_persons_client
+
+        results = await client.batch([
+            ("get_person", {"person_id": 1}),
+            ("delete_person", {"person_id": 2}),
+        ])
+
+        assert results[0] == {"id": 1}
+        assert isinstance(results[1], ValueError)
+        mock_persons_client.get_person.assert_called_once_with(
+            person_id=1, include_fields=None, custom_fields_keys=None
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", ["missing", "_request", "invalidate_reference_caches", "batch"])
+    async def test_batch_rejects_unknown_methods(self, mock_http_client, name):
+        """Test that batch only dispatches to public async client methods"""
+        client = PipedriveClient(
+            api_token="test_token",
+            company_domain="test",
+            http_client=mock_http_client
+        )
+
+        with pytest.raises(ValueError, match="Unknown PipedriveClient method"):
+            await client.batch([(name, {})])
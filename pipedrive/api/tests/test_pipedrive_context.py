@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from pipedrive.api.pipedrive_context import (
+    HTTP_LIMITS,
+    PipedriveMCPContext,
+    build_http_timeout,
+    pipedrive_lifespan,
+)
+from pipedrive.pipedrive_config import settings
+
+
+class TestPipedriveLifespan:
+    """Tests for the pipedrive_lifespan context manager"""
+
+    async def test_lifespan_shares_one_pooled_http_client(self):
+        with patch(
+            "pipedrive.api.pipedrive_context.httpx.AsyncClient",
+            wraps=httpx.AsyncClient,
+        ) as mock_async_client:
+            async with pipedrive_lifespan(MagicMock()) as context:
+                assert isinstance(context, PipedriveMCPContext)
+                http_client = context.pipedrive_client.base_client.http_client
+                assert context.pipedrive_client.pipelines.base_client.http_client is http_client
+
+        mock_async_client.assert_called_once_with(
+            timeout=build_http_timeout(settings.timeout),
+            verify=settings.verify_ssl,
+            limits=HTTP_LIMITS,
+            http2=True,
+        )
+        assert http_client.is_closed
+        # Brotli and zstd decoders are installed, so httpx negotiates them
+        accept_encoding = http_client.headers["accept-encoding"]
+        assert "br" in accept_encoding
+        assert "zstd" in accept_encoding
+
+    def test_build_http_timeout_caps_connect(self):
+        timeout = build_http_timeout(30)
+
+        assert timeout.connect == 5.0
+        assert timeout.read == 30
+        assert timeout.write == 30
+        assert timeout.pool == 30
+
+    def test_build_http_timeout_short_request_timeout(self):
+        timeout = build_http_timeout(2)
+
+        assert timeout.connect == 2
+        assert timeout.read == 2
@@ -36,4 +36,22 @@ def mock_pipedrive_client():
         "success": True
     }
     
-    return client
\ No newline at end of file
+    return client
+
+
+@pytest.fixture
+def stub_client_method(monkeypatch):
+    """
+    Replace a client mock's method with a plain coroutine returning a value.
+
+    For tests that only check the tool's response and never inspect the
+    call. Called as stub(client, method_name, value); the original mock is
+    restored after the test. Feature conftests bind it to their own client.
+    """
+    def stub(client, method_name, value):
+        async def method(*args, **kwargs):
+            return value
+
+        monkeypatch.setattr(client, method_name, method)
+
+    return stub
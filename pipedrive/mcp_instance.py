@@ -1,19 +1,19 @@
 import os
 from typing import List, Optional
 
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+# Importing the context loads pipedrive_config, which reads .env into the
+# environment once for the whole process
 from .api.pipedrive_context import pipedrive_lifespan  # Relative import
 
-load_dotenv()
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
 
-# Use 127.0.0.1 as the default host instead of 0.0.0.0 for better security
-default_host = "127.0.0.1"
+# Use 127.0.0.1 as the default host instead of 0.0.0.0 for better security.
 # If running in a container, we need to use 0.0.0.0 to expose the port
-if os.getenv("CONTAINER_MODE", "false").lower() == "true":
-    default_host = "0.0.0.0"
+container_mode = os.getenv("CONTAINER_MODE", "").lower() in _TRUE_VALUES
+default_host = "0.0.0.0" if container_mode else "127.0.0.1"
 
 # Create the FastMCP instance
 mcp = FastMCP(
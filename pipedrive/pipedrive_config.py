@@ -31,6 +31,7 @@ class PipedriveSettings(BaseModel):
     retry_attempts: int = Field(3, description="Number of retry attempts for failed requests")
     retry_backoff: float = Field(0.5, description="Exponential backoff factor for retries")
     verify_ssl: bool = Field(True, description="Whether to verify SSL certificates")
+    cache_ttl: int = Field(60, description="Seconds to cache reference data such as pipelines and stages (0 disables)")
 
     # Logging settings
     log_requests: bool = Field(False, description="Whether to log API requests")
@@ -149,6 +150,22 @@ class PipedriveSettings(BaseModel):
         if value > 5:
             raise ValueError("Retry backoff factor should not exceed 5")
         return value
+
+    @field_validator('cache_ttl')
+    @classmethod
+    def validate_cache_ttl(cls, value):
+        """
+        Validate cache TTL is non-negative.
+
+        Requirements:
+        - Must be non-negative (0 disables caching)
+
+        Raises:
+            ValueError: If cache TTL is negative
+        """
+        if value < 0:
+            raise ValueError("Cache TTL cannot be negative")
+        return value
     
     @classmethod
     def from_env(cls):
@@ -162,6 +179,7 @@ class PipedriveSettings(BaseModel):
         - PIPEDRIVE_TIMEOUT: Optional
         - PIPEDRIVE_RETRY_ATTEMPTS: Optional
         - PIPEDRIVE_RETRY_BACKOFF: Optional
+        - PIPEDRIVE_CACHE_TTL: Optional
         - PIPEDRIVE_LOG_REQUESTS: Optional
         - PIPEDRIVE_LOG_RESPONSES: Optional
         - VERIFY_SSL: Optional (defaults to True)
@@ -182,6 +200,11 @@ class PipedriveSettings(BaseModel):
         except ValueError:
             retry_backoff = 0.5
 
+        try:
+            cache_ttl = int(os.getenv("PIPEDRIVE_CACHE_TTL", "60"))
+        except ValueError:
+            cache_ttl = 60
+
         return cls(
             api_token=os.getenv("PIPEDRIVE_API_TOKEN", ""),
             company_domain=os.getenv("PIPEDRIVE_COMPANY_DOMAIN", ""),
@@ -189,6 +212,7 @@ class PipedriveSettings(BaseModel):
             timeout=timeout,
             retry_attempts=retry_attempts,
             retry_backoff=retry_backoff,
+            cache_ttl=cache_ttl,
             verify_ssl=os.getenv("VERIFY_SSL", "true").lower() != "false",
             log_requests=os.getenv("PIPEDRIVE_LOG_REQUESTS", "").lower() == "true",
             log_responses=os.getenv("PIPEDRIVE_LOG_RESPONSES", "").lower() == "true",
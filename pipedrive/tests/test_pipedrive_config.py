@@ -22,6 +22,7 @@ class TestPipedriveSettings:
         assert settings.timeout == 30
         assert settings.retry_attempts == 3
         assert settings.retry_backoff == 0.5
+        assert settings.cache_ttl == 60
         assert settings.verify_ssl is True
         assert settings.log_requests is False
         assert settings.log_responses is False
@@ -146,6 +147,26 @@ class TestPipedriveSettings:
 
         assert "Retry backoff factor should not exceed 5" in str(excinfo.value)
 
+    def test_cache_ttl_validation(self):
+        """Test validation for cache_ttl field."""
+        # Zero disables caching and is allowed
+        settings = PipedriveSettings(
+            api_token="test_token_12345678901234567890",
+            company_domain="testcompany",
+            cache_ttl=0,
+        )
+        assert settings.cache_ttl == 0
+
+        # Negative TTL
+        with pytest.raises(ValidationError) as excinfo:
+            PipedriveSettings(
+                api_token="test_token_12345678901234567890",
+                company_domain="testcompany",
+                cache_ttl=-1,
+            )
+
+        assert "Cache TTL cannot be negative" in str(excinfo.value)
+
     @patch.dict(
         os.environ,
         {
@@ -155,6 +176,7 @@ class TestPipedriveSettings:
             "PIPEDRIVE_TIMEOUT": "60",
             "PIPEDRIVE_RETRY_ATTEMPTS": "5",
             "PIPEDRIVE_RETRY_BACKOFF": "2.0",
+            "PIPEDRIVE_CACHE_TTL": "120",
             "VERIFY_SSL": "false",
             "PIPEDRIVE_LOG_REQUESTS": "true",
             "PIPEDRIVE_LOG_RESPONSES": "true",
@@ -170,6 +192,7 @@ class TestPipedriveSettings:
         assert settings.timeout == 60
         assert settings.retry_attempts == 5
         assert settings.retry_backoff == 2.0
+        assert settings.cache_ttl == 120
         assert settings.verify_ssl is False
         assert settings.log_requests is True
         assert settings.log_responses is True
@@ -182,6 +205,7 @@ class TestPipedriveSettings:
             "PIPEDRIVE_TIMEOUT": "invalid",
             "PIPEDRIVE_RETRY_ATTEMPTS": "not_a_number",
             "PIPEDRIVE_RETRY_BACKOFF": "bad_float",
+            "PIPEDRIVE_CACHE_TTL": "soon",
         },
     )
     def test_from_env_with_invalid_numeric_values(self):
@@ -192,6 +216,7 @@ class TestPipedriveSettings:
         assert settings.timeout == 30
         assert settings.retry_attempts == 3
         assert settings.retry_backoff == 0.5
+        assert settings.cache_ttl == 60
 
     @patch.dict(
         os.environ,
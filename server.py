@@ -1,8 +1,6 @@
 import asyncio
 import os
 
-from dotenv import load_dotenv
-
 from log_config import logger
 
 # Import feature registry and discovery
@@ -12,8 +10,6 @@ from pipedrive.feature_config import FeatureConfig
 from pipedrive.api.pipedrive_context import pipedrive_lifespan
 from pipedrive.mcp_instance import mcp
 
-load_dotenv()
-
 # Discover and register all features
 discover_features()
 
@@ -22,8 +18,9 @@ feature_config = FeatureConfig()
 
 async def main():
     transport = os.getenv("TRANSPORT", "sse")
-    server_host = os.getenv("HOST", "0.0.0.0")
-    server_port = int(os.getenv("PORT", "8152"))
+    # Host and port are resolved once, when the FastMCP instance is created
+    server_host = mcp.settings.host
+    server_port = mcp.settings.port
     
     # Log enabled features
     enabled_features = feature_config.get_enabled_features()
@@ -52,5 +49,20 @@ async def main():
             await mcp.run_sse_async()
 
 
+def run() -> None:
+    """Run the server, on uvloop when it is installed and not disabled."""
+    if os.getenv("USE_UVLOOP", "true").lower() != "false":
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not installed, using the default asyncio event loop")
+        else:
+            logger.info("Using uvloop event loop")
+            uvloop.run(main())
+            return
+
+    asyncio.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file